@@ -42,6 +42,7 @@ setup(
             "config/*.yaml",
             "assets/*.ico",
             "assets/*.png",
+            "assets/*.qss",
         ],
     },
 ) 
\ No newline at end of file
@@ -24,6 +24,7 @@ class AutoSenderState:
     is_running: bool = False
     first_run: bool = True
     last_run_hour: Optional[int] = None
+    pending_reload: bool = False
     error_tracker: ErrorTracker = ErrorTracker()
 
 class AutoSender:
@@ -184,8 +185,27 @@ class AutoSender:
                 self.state.error_tracker.log_error("page_access", goto_error)
                 raise NetworkError(f"Failed to recover page: {str(goto_error)}", goto_error)
 
-    def start(self) -> None:
-        """Start the auto-send process with enhanced error handling and logging."""
+    def seconds_until_next_hour(self) -> float:
+        """Seconds left until the next full hour."""
+        return max(0.0, (self.get_next_full_hour() - datetime.now()).total_seconds())
+
+    def _report(self, message: str) -> None:
+        """Forward a progress message to the callback, if any."""
+        if self.progress_callback:
+            self.progress_callback(message)
+
+    def _schedule_next_hour(self) -> float:
+        """Announce the wait for the next full hour and return its length in seconds."""
+        self._report(f"Waiting until next hour ({self.get_next_full_hour().strftime('%H:%M')})")
+        return self.seconds_until_next_hour()
+
+    def begin(self) -> float:
+        """
+        Mark the auto-send process as running without blocking.
+
+        Returns:
+            float: Seconds to wait before the first call to tick().
+        """
         if not self.page:
             raise ConfigurationError("No browser page provided")
 
@@ -193,103 +213,95 @@ class AutoSender:
         self.state = AutoSenderState()
         self.state.is_running = True
         logger.info("Auto-send process started")
-        
-        if self.progress_callback:
-            self.progress_callback("Auto-send process started")
-        
+        self._report("Auto-send process started")
+        return self._schedule_next_hour()
+
+    def tick(self) -> float:
+        """
+        Run the step that is due now: either the hourly submission or the
+        page reload that follows it.
+
+        Returns:
+            float: Seconds to wait before the next call to tick().
+        """
+        if self.state.pending_reload:
+            self.state.pending_reload = False
+            self._report("Reloading page...")
+            try:
+                self.page.reload()
+                self.page.wait_for_load_state("networkidle")
+                self._report("Page reloaded successfully")
+            except Exception as e:
+                self.state.error_tracker.log_error("page_reload", e)
+                self._report(f"Error reloading page: {str(e)}")
+                try:
+                    self.handle_page_error()
+                except Exception as recover_error:
+                    self.state.error_tracker.log_error("page_access", recover_error)
+                    self._report(f"Error reloading page: {str(recover_error)}")
+            return self._schedule_next_hour()
+
+        try:
+            # Use the hour at which this tick fires
+            current_hour = datetime.now().hour
+            self._report(f"Processing data for hour {current_hour}:00")
+
+            # If this is the first run, reload the page before starting
+            if self.state.first_run:
+                logger.info("First run detected - reloading page to ensure fresh start")
+                self._report("First run - reloading page")
+                self.page.reload()
+                self.page.wait_for_load_state("networkidle")
+                self.state.first_run = False
+
+            logger.info(f"Starting data submission for hour {current_hour}:00")
+
+            # Fill and submit form
+            if self.fill_form(current_hour) and self.submit_form():
+                self.state.last_run_hour = current_hour
+                success_msg = f"Data submitted successfully for {current_hour}:00"
+                logger.info(success_msg)
+                self._report(success_msg)
+
+                # Reload the page a little while after sending
+                reload_delay = self.config.reload_delay
+                self._report(f"Waiting {reload_delay} seconds before reload...")
+                self.state.pending_reload = True
+                return reload_delay
+
+            error_msg = "Form submission failed"
+            logger.error(error_msg)
+            self._report(error_msg)
+            return max(60.0, self._schedule_next_hour())
+
+        except Exception as e:
+            self.state.error_tracker.log_error("main_loop", e)
+            self._report(f"Error in auto-send: {str(e)}")
+            retry_interval = self.config.network.retry_interval
+            retry_msg = f"Retrying in {retry_interval} seconds..."
+            logger.warning(retry_msg)
+            self._report(retry_msg)
+            # Reload after the retry interval, then wait for the next hour again
+            self.state.pending_reload = True
+            return retry_interval
+
+    def start(self) -> None:
+        """Start the auto-send process and block until it is stopped."""
+        delay = self.begin()
         try:
             while self.state.is_running:
-                try:
-                    # Wait until next full hour first
-                    if self.progress_callback:
-                        next_hour = self.get_next_full_hour()
-                        self.progress_callback(f"Waiting until next hour ({next_hour.strftime('%H:%M')})")
-                    
-                    self.wait_until_next_hour()
-                    
-                    if not self.state.is_running:
-                        logger.info("Auto-send process stopped during wait")
-                        if self.progress_callback:
-                            self.progress_callback("Auto-send process stopped during wait")
-                        break
-
-                    # Get the current hour AFTER waiting for the next full hour
-                    current_time = datetime.now()
-                    current_hour = current_time.hour
-                    
-                    if self.progress_callback:
-                        self.progress_callback(f"Processing data for hour {current_hour}:00")
-                    
-                    # If this is the first run, reload the page before starting
-                    if self.state.first_run:
-                        logger.info("First run detected - reloading page to ensure fresh start")
-                        if self.progress_callback:
-                            self.progress_callback("First run - reloading page")
-                        self.page.reload()
-                        self.page.wait_for_load_state("networkidle")
-                        self.state.first_run = False
-                    
-                    logger.info(f"Starting data submission for hour {current_hour}:00")
-                    
-                    # Fill and submit form
-                    if self.fill_form(current_hour) and self.submit_form():
-                        self.state.last_run_hour = current_hour
-                        success_msg = f"Data submitted successfully for {current_hour}:00"
-                        logger.info(success_msg)
-                        if self.progress_callback:
-                            self.progress_callback(success_msg)
-                        
-                        # Wait 2 minutes before reloading
-                        if self.progress_callback:
-                            self.progress_callback("Waiting 2 minutes before reload...")
-                        time.sleep(2 * 60)
-                        
-                        # Always reload the page after 2 minutes
-                        if self.progress_callback:
-                            self.progress_callback("Reloading page...")
-                        try:
-                            self.page.reload()
-                            self.page.wait_for_load_state("networkidle")
-                            if self.progress_callback:
-                                self.progress_callback("Page reloaded successfully")
-                        except Exception as e:
-                            self.state.error_tracker.log_error("page_reload", e)
-                            if self.progress_callback:
-                                self.progress_callback(f"Error reloading page: {str(e)}")
-                            self.handle_page_error()
-                    else:
-                        error_msg = "Form submission failed"
-                        logger.error(error_msg)
-                        if self.progress_callback:
-                            self.progress_callback(error_msg)
-                        time.sleep(60)
-
-                except Exception as e:
-                    self.state.error_tracker.log_error("main_loop", e)
-                    error_msg = f"Error in auto-send: {str(e)}"
-                    if self.progress_callback:
-                        self.progress_callback(error_msg)
-                    if self.state.is_running:
-                        retry_msg = "Retrying in 1 minute..."
-                        logger.warning(retry_msg)
-                        if self.progress_callback:
-                            self.progress_callback(retry_msg)
-                        time.sleep(60)
-                        try:
-                            self.page.reload()
-                            self.page.wait_for_load_state("networkidle")
-                        except Exception as reload_error:
-                            self.state.error_tracker.log_error("page_reload", reload_error)
-                            if self.progress_callback:
-                                self.progress_callback(f"Error reloading page: {str(reload_error)}")
-                            time.sleep(300)
+                time.sleep(delay)
+                if not self.state.is_running:
+                    logger.info("Auto-send process stopped during wait")
+                    self._report("Auto-send process stopped during wait")
+                    break
+                delay = self.tick()
 
         except Exception as e:
             self.state.error_tracker.log_error("fatal_error", e)
             fatal_error_msg = f"Fatal error in auto-send process: {str(e)}"
             logger.error(fatal_error_msg)
-            if self.progress_callback:
-                self.progress_callback(fatal_error_msg)
+            self._report(fatal_error_msg)
         finally:
             self.stop()
 
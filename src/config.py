@@ -25,6 +25,8 @@ class AutoSenderConfig:
     network: NetworkConfig = field(default_factory=NetworkConfig)
     log_level: str = "INFO"
     base_url: str = "https://bmkgsatu.bmkg.go.id/meteorologi/sinoptik"
+    # Seconds between a successful hourly send and the follow-up page reload
+    reload_delay: int = 120
 
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'AutoSenderConfig':
@@ -36,7 +38,8 @@ class AutoSenderConfig:
             retry=retry_config,
             network=network_config,
             log_level=config_dict.get('log_level', 'INFO'),
-            base_url=config_dict.get('base_url', cls.base_url)
+            base_url=config_dict.get('base_url', cls.base_url),
+            reload_delay=config_dict.get('reload_delay', cls.reload_delay)
         )
 
     @classmethod
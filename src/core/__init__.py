@@ -1,9 +1,22 @@
 """
 Core functionality for BMKG Auto Input.
 """
+from importlib import import_module
 
-from .autoinput import AutoInput
-from .browsermanager import BrowserManager
-from .browserloader import BrowserLoader
+# Submodules are imported on first attribute access so that importing a light
+# module such as core.metar_reader does not pull in Playwright and tkinter.
+_LAZY_EXPORTS = {
+    'AutoInput': '.autoinput',
+    'BrowserManager': '.browsermanager',
+    'BrowserLoader': '.browserloader',
+}
 
-__all__ = ['AutoInput', 'BrowserManager', 'BrowserLoader'] 
\ No newline at end of file
+__all__ = ['AutoInput', 'BrowserManager', 'BrowserLoader']
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,37 @@ from ..utils import get_logger
 
 logger = get_logger(__name__)
 
+# Opsi pada dropdown ant-select yang sedang terbuka
+VISIBLE_OPTION_SELECTOR = ".ant-select-dropdown:not(.ant-select-dropdown-hidden) [role='option']"
+
+# CSS untuk mematikan animasi/transisi ant-design agar dropdown langsung actionable
+DISABLE_ANIMATIONS_CSS = (
+    "*,*::before,*::after{animation:none!important;"
+    "transition:none!important;caret-color:transparent!important}"
+)
+
+# Id of the injected style tag; a page reused across fills keeps a single copy
+ANIMATIONS_STYLE_ID = "autoinput-no-animations"
+_INJECT_STYLE_JS = """([id, css]) => {
+    if (document.getElementById(id)) return;
+    const style = document.createElement('style');
+    style.id = id;
+    style.textContent = css;
+    document.head.appendChild(style);
+}"""
+
+
+def _cloud_option(value):
+    """Pattern for a cloud type option such as "0 - cirrus (Ci)".
+
+    value is either an awan_lapisan text ("- cirrus (Ci)"), matched as the end of
+    the option, or a bare code ("0"), matched as its start.
+    """
+    if "-" in value:
+        return re.compile(rf"{re.escape(value)}\s*$")
+    return re.compile(rf"^\s*{re.escape(value)}\s*-")
+
+
 class AutoInput:
     def __init__(self, page, user_input, obs, ww, w1w2, awan_lapisan, arah_angin, ci, cm, ch):
         """
@@ -26,6 +57,64 @@ class AutoInput:
         self.cm = cm
         self.ch = ch
 
+    def update_user_input(self, user_input):
+        """
+        Ganti data user_input agar objek yang sama bisa dipakai untuk pengisian berikutnya.
+
+        Args:
+            user_input: Dictionary berisi input data dari pengguna.
+        """
+        self.user_input = user_input
+
+    def disable_animations(self):
+        """Inject DISABLE_ANIMATIONS_CSS unless the current document already has it."""
+        self.page.evaluate(_INJECT_STYLE_JS, [ANIMATIONS_STYLE_ID, DISABLE_ANIMATIONS_CSS])
+
+    def click_option(self, name):
+        """Click an option in the currently open ant-select dropdown.
+
+        A string must match the whole option text; pass a compiled pattern to match
+        part of it. Several matching options raise (strict mode) instead of picking one.
+        """
+        try:
+            if isinstance(name, str):
+                name = re.compile(rf"^\s*{re.escape(name)}\s*$")
+            self.page.locator(VISIBLE_OPTION_SELECTOR).filter(has_text=name).click()
+        except Exception as e:
+            logger.error(f"Error clicking dropdown option {name}: {e}")
+            raise
+
+    def _settle(self, action, quiet_ms=250, max_ms=2000):
+        """Run action, then wait until no request has been in flight for quiet_ms, giving up after max_ms.
+
+        The request listeners are attached before action runs, so the requests it
+        triggers are always waited for. Used instead of wait_for_load_state("networkidle"),
+        which can stall on long-running background requests.
+        """
+        inflight = set()
+        on_start = inflight.add
+        on_done = inflight.discard
+
+        self.page.on("request", on_start)
+        self.page.on("requestfinished", on_done)
+        self.page.on("requestfailed", on_done)
+        try:
+            action()
+            deadline = time.monotonic() + max_ms / 1000
+            quiet_since = time.monotonic()
+            while time.monotonic() < deadline:
+                # wait_for_timeout juga memproses event Playwright yang tertunda
+                self.page.wait_for_timeout(50)
+                if inflight:
+                    quiet_since = time.monotonic()
+                elif (time.monotonic() - quiet_since) * 1000 >= quiet_ms:
+                    return
+            logger.debug(f"Network belum tenang setelah {max_ms} ms, lanjutkan pengisian")
+        finally:
+            self.page.remove_listener("request", on_start)
+            self.page.remove_listener("requestfinished", on_done)
+            self.page.remove_listener("requestfailed", on_done)
+
     def input_cloud_layer_2(self):
         """Mengisi data untuk lapisan awan kedua (CL Lapisan 2) berdasarkan user_input."""
         page = self.page
@@ -37,7 +126,7 @@ class AutoInput:
         # 26 Jenis CL Lapisan 2
         jenis_cl_lap2_value = self.awan_lapisan.get(self.user_input['jenis_cl_lapisan2'], "0")
         page.locator("div:nth-child(3) > div:nth-child(3) > .ant-select > .ant-select-selection").first.click()
-        page.get_by_role("option", name=jenis_cl_lap2_value).click()
+        self.click_option(_cloud_option(jenis_cl_lap2_value))
 
         # 27 Jumlah CL Lapisan 2
         # page.locator("div:nth-child(3) > div:nth-child(3) > .ant-select").first.press("Tab")
@@ -73,15 +162,16 @@ class AutoInput:
             user_input = self.user_input
 
             print("Memulai Proses Input Data...")
+            self.disable_animations()
 
             # Pilih stasiun
             page.locator("#select-station div").nth(1).click()
-            page.get_by_role("option", name=re.compile(r"^Stasiun")).click()
+            self.click_option(re.compile(r"^Stasiun"))
 
             # pilih observer on duty
             obs_onduty_value = self.obs.get(user_input['obs_onduty'].lower(), "Zulkifli Ramadhan")
             page.locator("#select-observer div").nth(1).click()
-            page.get_by_role("option", name=obs_onduty_value).click()
+            self.click_option(obs_onduty_value)
 
             # Tanggal Pengamatan
             today = datetime.now(timezone.utc)
@@ -100,8 +190,7 @@ class AutoInput:
             # 1 Jam Pengamatan
             page.locator("#input-jam div").nth(1).click()
             page.locator("#input-jam").get_by_role("textbox").fill(user_input['jam_pengamatan'])
-            page.locator("#input-jam").get_by_role("textbox").press("Enter")
-            page.wait_for_load_state("networkidle")
+            self._settle(lambda: page.locator("#input-jam").get_by_role("textbox").press("Enter"))
 
             # conditional pengisian parameter tertentu pada jam-jam penting
             jam_penting = int(user_input['jam_pengamatan'])
@@ -224,7 +313,7 @@ class AutoInput:
             cl_value = self.ci.get(user_input['cl_dominan'], "0")
             page.locator("#cloud_low_type_cl div").nth(1).click()
             if cl_value == "1":
-                page.get_by_role("option", name="1 - cumulus humilis atau").click()
+                self.click_option(re.compile(r"^\s*1 - cumulus humilis atau"))
             else:
                 page.locator("#cloud_low_type_cl").get_by_role("textbox").fill(cl_value)
                 page.locator("#cloud_low_type_cl").get_by_role("textbox").press("Enter")
@@ -238,7 +327,7 @@ class AutoInput:
                 # 19 Jenis CL Lapisan 1
                 jenis_cl_lap1_value = self.awan_lapisan.get(user_input['jenis_cl_lapisan1'], "8")
                 page.locator("div:nth-child(3) > .ant-select > .ant-select-selection").first.click()
-                page.get_by_role("option", name=jenis_cl_lap1_value).click()
+                self.click_option(_cloud_option(jenis_cl_lap1_value))
 
                 # 20 Jumlah CL Lapisan 1
                 page.locator("div:nth-child(4) > .ant-select > .ant-select-selection").first.click()
@@ -293,7 +382,7 @@ class AutoInput:
                 # 32 Jenis Awan Menengah
                 jenis_awan_menengah_value = self.awan_lapisan.get(user_input['jenis_awan_menengah'], "3")
                 page.locator(".col-4 > div:nth-child(3) > .ant-select > .ant-select-selection").first.click()
-                page.get_by_role("option", name=jenis_awan_menengah_value).click()
+                self.click_option(_cloud_option(jenis_awan_menengah_value))
 
                 # 33 Jumlah awan menengah
                 jumlah_awan_menengah = user_input['ncm_awan_menengah']
@@ -326,7 +415,7 @@ class AutoInput:
                 # 38 jenis awan tinggi
                 jenis_awan_tinggi_value = self.awan_lapisan.get(user_input['ch_awan_tinggi'], "0")
                 page.locator("div:nth-child(3) > .card > .card-body > #collapse-row-2 > div > div:nth-child(2) > div:nth-child(3) > .ant-select > .ant-select-selection > .ant-select-selection__rendered").click()
-                page.get_by_role("option", name=jenis_awan_tinggi_value).click()
+                self.click_option(_cloud_option(jenis_awan_tinggi_value))
 
                 # # 39 Jumlah awan tinggi
                 jumlah_awan_tinggi = user_input['nch_awan_tinggi']
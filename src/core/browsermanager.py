@@ -30,6 +30,8 @@ class BrowserManager:
         self.page = None
         self.user_data_dir = user_data_dir
         self.current_page = None
+        # One open tab per page type, reused when switching between them
+        self._pages = {}
 
     def start_browser(self, page_type='auto_input'):
         """Start the browser and load the specified page.
@@ -46,7 +48,10 @@ class BrowserManager:
             loader = BrowserLoader(playwright=self.playwright, user_data_dir=self.user_data_dir, headless=False)
             self.page = loader.load_page(self.URLS[page_type])
             self.browser = loader.browser
+            # launch_persistent_context returns the BrowserContext itself
+            self.context = self.page.context
             self.current_page = page_type
+            self._pages = {page_type: self.page}
             
             # Set viewport to full screen
             self.page.set_viewport_size({"width": 1920, "height": 920})
@@ -72,16 +77,45 @@ class BrowserManager:
             
         try:
             if page_type != self.current_page:
-                self.page.goto(self.URLS[page_type])
+                page = self._pages.get(page_type)
+                if page is None or page.is_closed():
+                    # First visit: open the page in its own tab and keep it
+                    page = self.context.new_page()
+                    page.set_viewport_size({"width": 1920, "height": 920})
+                    page.goto(self.URLS[page_type])
+                    page.wait_for_load_state("networkidle")
+                    self._pages[page_type] = page
+                    logger.info(f"Opened {page_type} page in a new tab")
+                else:
+                    page.bring_to_front()
+                    logger.info(f"Switched to {page_type} tab")
+                self.page = page
                 self.current_page = page_type
-                self.page.wait_for_load_state("networkidle")
-                logger.info(f"Navigated to {page_type} page")
         except Exception as e:
             logger.error(f"Failed to navigate to {page_type} page: {str(e)}")
             raise
 
+    def reopen_page(self):
+        """Replace the current page with a new tab in the same persistent context.
+
+        Reuses the running browser, its cookies and HTTP cache instead of
+        relaunching Playwright.
+        """
+        if self.page and not self.page.is_closed():
+            self.page.close()
+        self.page = self.context.new_page()
+        self.page.set_viewport_size({"width": 1920, "height": 920})
+        self.page.goto(self.URLS[self.current_page or 'auto_input'])
+        self.page.wait_for_load_state("networkidle")
+        self._pages[self.current_page or 'auto_input'] = self.page
+        logger.info(f"Reopened {self.current_page} page in the existing browser context")
+
     def reload_page(self):
         """Reload the current page."""
+        if self.page and self.page.is_closed() and self.context:
+            # The tab was closed by the user; open a new one instead of failing
+            self.reopen_page()
+            return
         if self.page:
             try:
                 self.page.reload()
@@ -99,7 +133,9 @@ class BrowserManager:
             if self.playwright:
                 self.playwright.stop()
             self.browser = None
+            self.context = None
             self.page = None
+            self._pages = {}
             self.playwright = None
             self.current_page = None
             logger.info("Browser stopped successfully")
@@ -4,10 +4,31 @@ METAR code parsing functionality.
 import re
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+# Token patterns are compiled once at import and shared by every MetarReader
+METAR_SHAPE_PATTERN = re.compile(r"^METAR\s+[A-Z]{4}\s+\d{6}Z?\s")
+DATETIME_PATTERN = re.compile(r"\d{6}")
+WIND_PATTERN = re.compile(r"(VRB|\d{3})(\d{2,3})(?:G\d{2,3})?KT")
+WIND_VARIATION_PATTERN = re.compile(r"(\d{3})V(\d{3})")
+CLOUD_PATTERN = re.compile(r"(FEW|SCT|BKN|OVC)(\d{3})(CB|TCU)?")
+TEMPERATURE_PATTERN = re.compile(r"(M?\d{2})/(M?\d{2})")
+PRESSURE_PATTERN = re.compile(r"Q(\d{4})")
+
+# Token categories are looked up by hashing a fixed-width prefix instead of
+# scanning a prefix list: intensity signs are one character, weather
+# descriptors/phenomena two, cloud amounts three
+WEATHER_INTENSITY = frozenset("+-")
+WEATHER_CODES = frozenset({
+    "VC", "MI", "BC", "PR", "DR", "BL", "SH", "TS", "FZ", "DZ", "RA", "SN", "SG", "IC", "PL",
+    "GR", "GS", "UP", "BR", "FG", "FU", "VA", "DU", "SA", "HZ", "PY", "PO", "SQ", "FC", "SS", "DS"
+})
+CLOUD_AMOUNTS = frozenset({"FEW", "SCT", "BKN", "OVC"})
+TREND_TYPES = frozenset({"NOSIG", "TEMPO", "BECMG"})
+
 class MetarReader:
     """Parses METAR codes into structured data."""
 
@@ -69,7 +90,7 @@ class MetarReader:
         # Remove Z suffix if present
         datetime_part = datetime_part.rstrip('Z')
         
-        if not re.match(r"\d{6}", datetime_part):
+        if not DATETIME_PATTERN.match(datetime_part):
             raise ValueError(f"Invalid date/time format: {datetime_part}")
             
         day = datetime_part[:2]
@@ -95,7 +116,7 @@ class MetarReader:
             return "VRB", "00", None, None
         
         # Handle standard wind format (dddssKT or VRBssKT)
-        match = re.match(r"(VRB|\d{3})(\d{2,3})(?:G\d{2,3})?KT", wind_part)
+        match = WIND_PATTERN.match(wind_part)
         if not match:
             raise ValueError(f"Invalid wind format: {wind_part}")
         
@@ -103,9 +124,9 @@ class MetarReader:
         
         # Check for variable wind direction range
         next_part = self._peek_next_part()
-        if next_part and re.match(r"\d{3}V\d{3}", next_part):
+        if next_part and WIND_VARIATION_PATTERN.match(next_part):
             var_part = self._get_next_part()
-            var_match = re.match(r"(\d{3})V(\d{3})", var_part)
+            var_match = WIND_VARIATION_PATTERN.match(var_part)
             if var_match:
                 variable_from, variable_to = var_match.groups()
         
@@ -140,7 +161,7 @@ class MetarReader:
         weather = []
         while True:
             part = self._peek_next_part()
-            if not part or not any(part.startswith(prefix) for prefix in ["+", "-", "VC", "MI", "BC", "PR", "DR", "BL", "SH", "TS", "FZ", "DZ", "RA", "SN", "SG", "IC", "PL", "GR", "GS", "UP", "BR", "FG", "FU", "VA", "DU", "SA", "HZ", "PY", "PO", "SQ", "FC", "SS", "DS"]):
+            if not part or not (part[0] in WEATHER_INTENSITY or part[:2] in WEATHER_CODES):
                 break
             weather.append(self._get_next_part())
         return weather
@@ -154,11 +175,11 @@ class MetarReader:
         clouds = []
         while self.current_index < len(self.parts):
             part = self._peek_next_part()
-            if not any(part.startswith(prefix) for prefix in ["FEW", "SCT", "BKN", "OVC"]):
+            if part[:3] not in CLOUD_AMOUNTS:
                 break
                 
             cloud_part = self._get_next_part()
-            match = re.match(r"(FEW|SCT|BKN|OVC)(\d{3})(CB|TCU)?", cloud_part)
+            match = CLOUD_PATTERN.match(cloud_part)
             if not match:
                 raise ValueError(f"Invalid cloud format: {cloud_part}")
                 
@@ -180,7 +201,7 @@ class MetarReader:
         Returns:
             tuple: (temperature, dew_point)
         """
-        match = re.match(r"(M?\d{2})/(M?\d{2})", temp_part)
+        match = TEMPERATURE_PATTERN.match(temp_part)
         if not match:
             raise ValueError(f"Invalid temperature format: {temp_part}")
             
@@ -198,7 +219,7 @@ class MetarReader:
         Returns:
             str: Pressure value
         """
-        match = re.match(r"Q(\d{4})", pressure_part)
+        match = PRESSURE_PATTERN.match(pressure_part)
         if not match:
             raise ValueError(f"Invalid pressure format: {pressure_part}")
             
@@ -216,7 +237,7 @@ class MetarReader:
         if not part:
             return trend_info
             
-        if part in ["NOSIG", "TEMPO", "BECMG"]:
+        if part in TREND_TYPES:
             trend_info["type"] = self._get_next_part()
             
             # Parse additional trend information (e.g., TL0730)
@@ -316,4 +337,20 @@ class MetarReader:
 
         except Exception as e:
             logger.error(f"Error parsing METAR code: {e}")
-            raise ValueError(f"Failed to parse METAR code: {str(e)}") 
\ No newline at end of file
+            raise ValueError(f"Failed to parse METAR code: {str(e)}") 
+
+
+@lru_cache(maxsize=8)
+def parse_metar(metar_code: str) -> Dict[str, Any]:
+    """Parse a METAR code, reusing the result for recently parsed codes.
+
+    Retrying the same METAR after a timeout skips the parse entirely. The
+    returned dict is shared between calls and must not be modified.
+
+    Args:
+        metar_code: Raw METAR code string
+
+    Returns:
+        dict: Parsed METAR data
+    """
+    return MetarReader(metar_code).parse()
@@ -2,10 +2,10 @@
 Data handling components for BMKG Auto Input.
 """
 
-from .sandi import obs, ww, w1w2, ci, awan_lapisan, arah_angin, cm, ch
-from .user_input import UserInputUpdater, default_user_input
+from .sandi import obs, ww, w1w2, ci, awan_lapisan, arah_angin, arah_angin_lookup, cm, ch
+from .user_input import UserInputUpdater, default_user_input, read_input_file
 
 __all__ = [
-    'obs', 'ww', 'w1w2', 'ci', 'awan_lapisan', 'arah_angin', 'cm', 'ch',
-    'UserInputUpdater', 'default_user_input', 'InputProcessor'
+    'obs', 'ww', 'w1w2', 'ci', 'awan_lapisan', 'arah_angin', 'arah_angin_lookup', 'cm', 'ch',
+    'UserInputUpdater', 'default_user_input', 'read_input_file'
 ] 
\ No newline at end of file
@@ -1,7 +1,40 @@
 import logging
 import re
+import time
 from datetime import datetime, timezone
 
+from .sandi import arah_angin_lookup
+
+# Opsi pada dropdown ant-select yang sedang terbuka
+VISIBLE_OPTION_SELECTOR = ".ant-select-dropdown:not(.ant-select-dropdown-hidden) [role='option']"
+
+# CSS untuk mematikan animasi/transisi ant-design agar dropdown langsung actionable
+DISABLE_ANIMATIONS_CSS = (
+    "*,*::before,*::after{animation:none!important;"
+    "transition:none!important;caret-color:transparent!important}"
+)
+
+# Id of the injected style tag; a page reused across fills keeps a single copy
+ANIMATIONS_STYLE_ID = "autoinput-no-animations"
+_INJECT_STYLE_JS = """([id, css]) => {
+    if (document.getElementById(id)) return;
+    const style = document.createElement('style');
+    style.id = id;
+    style.textContent = css;
+    document.head.appendChild(style);
+}"""
+
+
+def _cloud_option(value):
+    """Pattern for a cloud type option such as "0 - cirrus (Ci)".
+
+    value is either an awan_lapisan text ("- cirrus (Ci)"), matched as the end of
+    the option, or a bare code ("0"), matched as its start.
+    """
+    if "-" in value:
+        return re.compile(rf"{re.escape(value)}\s*$")
+    return re.compile(rf"^\s*{re.escape(value)}\s*-")
+
 
 class AutoInput:
     def __init__(self, page, user_input, obs, ww, w1w2, awan_lapisan, arah_angin, ci, cm, ch):
@@ -29,6 +62,7 @@ class AutoInput:
         """Mengisi seluruh form berdasarkan input pengguna."""
         try:
             logging.info("Memulai Proses Input Data")
+            self.disable_animations()
             self.select_station_and_observer()
             self.select_date_and_time()
             self.fill_parameters_based_on_time()
@@ -47,6 +81,10 @@ class AutoInput:
             logging.error(f"Error filling form: {e}")
 
     # Helper Method
+    def disable_animations(self):
+        """Inject DISABLE_ANIMATIONS_CSS unless the current document already has it."""
+        self.page.evaluate(_INJECT_STYLE_JS, [ANIMATIONS_STYLE_ID, DISABLE_ANIMATIONS_CSS])
+
     def press_enter(self, locator):
         """Helper method to press 'Enter' after filling a field."""
         try:
@@ -56,6 +94,33 @@ class AutoInput:
             logging.error(f"Error pressing 'Enter' for locator: {locator}: {e}")
             raise
 
+    def arah_gerak_code(self, value):
+        """Kode sektor arah gerak awan; derajat yang bukan kunci tabel dihitung dari batas sektornya."""
+        code = self.arah_angin.get(value)
+        return code if code is not None else arah_angin_lookup(value)
+
+    def click_option(self, name):
+        """Helper to click an option in the currently open ant-select dropdown.
+
+        A string must match the whole option text; pass a compiled pattern to match
+        part of it. Several matching options raise (strict mode) instead of picking one.
+        """
+        try:
+            if isinstance(name, str):
+                name = re.compile(rf"^\s*{re.escape(name)}\s*$")
+            self.page.locator(VISIBLE_OPTION_SELECTOR).filter(has_text=name).click()
+        except Exception as e:
+            logging.error(f"Error clicking dropdown option {name}: {e}")
+            raise
+
+    def _combo_fill_enter(self, locator, value):
+        """Helper to open an ant-select combobox, type a value and confirm it with 'Enter'."""
+        combo = self.page.locator(locator)
+        combo.locator("div").nth(1).click()
+        textbox = combo.get_by_role("textbox")
+        textbox.fill(value)
+        textbox.press("Enter")
+
     def click_and_fill(self, locator, value):
         """Helper to click and fill a locator field."""
         try:
@@ -70,7 +135,7 @@ class AutoInput:
         """Helper to select an option from a dropdown."""
         try:
             self.page.locator(locator).click()
-            self.page.get_by_role("option", name=value).click()
+            self.click_option(value)
         except Exception as e:
             logging.error(f"Error selecting dropdown option {value} for {locator}: {e}")
             raise
@@ -89,11 +154,42 @@ class AutoInput:
         """Helper method to select a dropdown option by its name."""
         try:
             self.page.locator(locator).click()
-            self.page.get_by_role("option", name=option_name).click()
+            self.click_option(option_name)
         except Exception as e:
             logging.error(f"Error selecting dropdown option by name {option_name} for locator {locator}: {e}")
             raise
 
+    def _settle(self, action, quiet_ms=250, max_ms=2000):
+        """Run action, then wait until no request has been in flight for quiet_ms, giving up after max_ms.
+
+        The request listeners are attached before action runs, so the requests it
+        triggers are always waited for. Used instead of wait_for_load_state("networkidle"),
+        which can stall on long-running background requests.
+        """
+        inflight = set()
+        on_start = inflight.add
+        on_done = inflight.discard
+
+        self.page.on("request", on_start)
+        self.page.on("requestfinished", on_done)
+        self.page.on("requestfailed", on_done)
+        try:
+            action()
+            deadline = time.monotonic() + max_ms / 1000
+            quiet_since = time.monotonic()
+            while time.monotonic() < deadline:
+                # wait_for_timeout juga memproses event Playwright yang tertunda
+                self.page.wait_for_timeout(50)
+                if inflight:
+                    quiet_since = time.monotonic()
+                elif (time.monotonic() - quiet_since) * 1000 >= quiet_ms:
+                    return
+            logging.debug(f"Network belum tenang setelah {max_ms} ms, lanjutkan pengisian")
+        finally:
+            self.page.remove_listener("request", on_start)
+            self.page.remove_listener("requestfinished", on_done)
+            self.page.remove_listener("requestfailed", on_done)
+
     # Parameters to fill
     def select_station_and_observer(self):
         """Select station and observer based on user input."""
@@ -101,14 +197,12 @@ class AutoInput:
         try:
             # Select station
             self.page.locator("#select-station div").nth(1).click()
-            self.page.get_by_role("option", name=re.compile(r"^Stasiun")).click()
-
-            self.page.wait_for_load_state("networkidle")
+            self._settle(lambda: self.click_option(re.compile(r"^Stasiun")))
 
             # Select observer on duty
             obs_onduty_value = self.obs.get(self.user_input['obs_onduty'].lower(), "Zulkifli Ramadhan")
             self.page.locator("#select-observer div").nth(1).click()
-            self.page.get_by_role("option", name=obs_onduty_value).click()
+            self.click_option(obs_onduty_value)
 
         except Exception as e:
             logging.error(f"Error selecting station or observer: {e}")
@@ -127,10 +221,8 @@ class AutoInput:
             # This is the correct way to handle the #input-jam field
             self.page.locator("#input-jam div").nth(1).click()  # Click on the dropdown or div element
             self.page.locator("#input-jam").get_by_role("textbox").fill(self.user_input.get('jam_pengamatan', ''))
-            self.page.locator("#input-jam").get_by_role("textbox").press("Enter")
-
             # Ensure the page is fully loaded before proceeding
-            self.page.wait_for_load_state("networkidle")
+            self._settle(lambda: self.page.locator("#input-jam").get_by_role("textbox").press("Enter"))
 
         except Exception as e:
             logging.error(f"Error selecting date or time: {e}")
@@ -198,9 +290,7 @@ class AutoInput:
             # self.page.locator("#wind_indicator_iw div").nth(1).click()  # Open the dropdown or activate the field
             # self.page.locator("#wind_indicator_iw").get_by_role("textbox").fill(
             #     self.user_input.get('pengenal_angin', ''))
-            self.get_by_role("option", name="4 - wind speed from").click()
-            self.locator("#wind_indicator_iw").get_by_role("combobox").click()
-            self.page.locator("#wind_indicator_iw").get_by_role("textbox").press("Enter")  # Press Enter to submit
+            self._combo_fill_enter("#wind_indicator_iw", "4")  # 4 - wind speed from anemometer (knot)
 
             # Fill wind direction (Arah Angin)
             self.click_and_fill_by_label("Arah Angin (derajat)", self.user_input.get('arah_angin', ''))
@@ -282,7 +372,7 @@ class AutoInput:
             cl_value = self.ci.get(self.user_input.get('cl_dominan', ''), "0")
             self.page.locator("#cloud_low_type_cl div").nth(1).click()  # Open the dropdown
             if cl_value == "1":
-                self.page.get_by_role("option", name="1 - cumulus humilis atau").click()
+                self.click_option(re.compile(r"^\s*1 - cumulus humilis atau"))
             else:
                 # Ensure filling in the correct field with better specificity
                 self.page.locator("#cloud_low_type_cl").get_by_role("textbox").fill(cl_value)
@@ -298,7 +388,7 @@ class AutoInput:
                 # 19 Jenis CL Lapisan 1
                 jenis_cl_lap1_value = self.awan_lapisan.get(self.user_input.get('jenis_cl_lapisan1', ''), "0")
                 self.page.locator("div:nth-child(3) > .ant-select > .ant-select-selection").first.click()
-                self.page.get_by_role("option", name=jenis_cl_lap1_value).click()
+                self.click_option(_cloud_option(jenis_cl_lap1_value))
 
                 # 20 Jumlah CL Lapisan 1
                 self.page.locator("div:nth-child(4) > .ant-select > .ant-select-selection").first.click()
@@ -319,7 +409,7 @@ class AutoInput:
         try:
             self.page.locator("#cloud_low_type_cl div").nth(1).click()
             if cl_value == "1":
-                self.page.get_by_role("option", name="1 - cumulus humilis atau").click()
+                self.click_option(re.compile(r"^\s*1 - cumulus humilis atau"))
             else:
                 self.click_and_fill("#cloud_low_type_cl", cl_value)
                 self.press_enter("#cloud_low_type_cl")
@@ -327,43 +417,6 @@ class AutoInput:
             logging.error(f"Error selecting CL type: {e}")
             raise
 
-    def fill_cl_additional_fields(self):
-        """Fills additional fields related to CL Dominant (low cloud)."""
-        logging.info("Filling additional CL fields")
-        try:
-            # 18 NCL Total (Jumlah Awan Rendah)
-            self.page.locator("#cloud_low_cover_oktas div").nth(1).click()  # Open the dropdown
-            self.page.locator("#cloud_low_cover_oktas").get_by_role("textbox").fill(
-                self.user_input.get('ncl_total', ''))
-            self.page.locator("#cloud_low_cover_oktas").get_by_role("textbox").press("Enter")
-
-            # 19 Jenis CL Lapisan 1
-            jenis_cl_lap1_value = self.awan_lapisan.get(self.user_input.get('jenis_cl_lapisan1', ''), "0")
-            self.page.locator("div:nth-child(3) > .ant-select > .ant-select-selection").first.click()
-            self.page.get_by_role("option", name=jenis_cl_lap1_value).click()
-
-            # 20 Jumlah CL Lapisan 1
-            self.page.locator("div:nth-child(4) > .ant-select > .ant-select-selection").first.click()
-            self.page.locator(
-                "div:nth-child(4) > .ant-select > .ant-select-selection__rendered > .ant-select-search__field__wrap > .ant-select-search__field").first.fill(
-                self.user_input.get('jumlah_cl_lapisan1', ''))
-            self.page.locator("div:nth-child(4) > .ant-select > .ant-select-selection").first.press("Enter")
-
-            # 21 Tinggi Dasar Awan Lapisan 1
-            self.page.locator("#cloud_low_base_1").click()
-            self.page.locator("#cloud_low_base_1").fill(self.user_input.get('tinggi_dasar_aw_lapisan1', ''))
-
-            # 23 Arah Gerak Awan Lapisan 1
-            arah_gerak_aw_lap1_value = self.arah_angin.get(self.user_input.get('arah_gerak_aw_lapisan1', ''), "0")
-            self.page.locator("div:nth-child(7) > .ant-select-selection__rendered").first.click()
-            self.page.locator(
-                "div:nth-child(7) > .ant-select-selection__rendered > .ant-select-search__field__wrap > .ant-select-search__field").first.fill(
-                arah_gerak_aw_lap1_value)
-
-        except Exception as e:
-            logging.error(f"Error filling additional CL fields: {e}")
-            raise
-
     def fill_special_cloud_layer_1(self, arah_gerak_aw_lap1_value):
         """Fills data for special cloud conditions (Cumulus or Cumulonimbus)."""
         logging.info("Filling special cloud data for Cumulus/Cumulonimbus")
@@ -400,14 +453,14 @@ class AutoInput:
             logging.info("Filling jenis CL Lapisan 2")
             jenis_cl_lap2_value = self.awan_lapisan.get(self.user_input.get('jenis_cl_lapisan2', ''), "0")
             self.select_dropdown_option("div:nth-child(3) > div:nth-child(3) > .ant-select > .ant-select-selection",
-                                        jenis_cl_lap2_value)
+                                        _cloud_option(jenis_cl_lap2_value))
 
             # 27 Jumlah CL Lapisan 2
             logging.info("Filling jumlah CL Lapisan 2")
             self.click_and_fill(
                 "div:nth-child(3) > div:nth-child(4) > .ant-select-selection__rendered > .ant-select-search__field__wrap > .ant-select-search__field",
                 self.user_input.get('jumlah_cl_lapisan2', ''))
-            self.page.get_by_role("option", name="oktas").click()
+            self.click_option(re.compile(r"oktas"))
 
             # 28 Tinggi Dasar Awan Lapisan 2
             logging.info("Filling tinggi dasar awan lapisan 2")
@@ -415,7 +468,7 @@ class AutoInput:
 
             # 29 Arah Gerak Awan Lapisan 2
             logging.info("Filling arah gerak awan lapisan 2")
-            arah_gerak_aw_lap2_value = self.arah_angin.get(self.user_input.get('arah_gerak_aw_lapisan2', ''), "0")
+            arah_gerak_aw_lap2_value = self.arah_gerak_code(self.user_input.get('arah_gerak_aw_lapisan2', ''))
             self.click_and_fill(
                 "div:nth-child(3) > div:nth-child(7) > .ant-select-selection__rendered > .ant-select-search__field",
                 arah_gerak_aw_lap2_value)
@@ -446,7 +499,7 @@ class AutoInput:
                 # 32 Jenis Awan Menengah
                 jenis_awan_menengah_value = self.awan_lapisan.get(self.user_input.get('jenis_awan_menengah', ''), "0")
                 self.page.locator(".col-4 > div:nth-child(3) > .ant-select > .ant-select-selection").first.click()
-                self.page.get_by_role("option", name=jenis_awan_menengah_value).click()
+                self.click_option(_cloud_option(jenis_awan_menengah_value))
 
                 # 33 Jumlah Awan Menengah
                 jumlah_awan_menengah = self.user_input['ncm_awan_menengah']
@@ -460,7 +513,7 @@ class AutoInput:
                 self.page.locator("#cloud_med_base_1").fill(self.user_input.get('tinggi_dasar_aw_cm', ''))
 
                 # 35 Arah Gerak Awan CM
-                arah_gerak_cm_value = self.arah_angin.get(self.user_input['arah_gerak_cm'], "0")
+                arah_gerak_cm_value = self.arah_gerak_code(self.user_input['arah_gerak_cm'])
                 self.page.locator(
                     "div:nth-child(6) > .ant-select > .ant-select-selection > .ant-select-selection__rendered").first.click()
                 self.page.locator(
@@ -490,7 +543,7 @@ class AutoInput:
                 # 38 jenis awan tinggi
                 jenis_awan_tinggi_value = self.awan_lapisan.get(self.user_input['ch_awan_tinggi'], "0")
                 self.page.locator("div:nth-child(3) > .card > .card-body > #collapse-row-2 > div > div:nth-child(2) > div:nth-child(3) > .ant-select > .ant-select-selection > .ant-select-selection__rendered").click()
-                self.page.get_by_role("option", name=jenis_awan_tinggi_value).click()
+                self.click_option(_cloud_option(jenis_awan_tinggi_value))
 
                 # # 39 Jumlah awan tinggi
                 jumlah_awan_tinggi = self.user_input['nch_awan_tinggi']
@@ -504,7 +557,7 @@ class AutoInput:
                 self.page.locator("#cloud_high_base_1").fill(self.user_input['tinggi_dasar_aw_ch'])
 
                 # 41 Arah Gerak Awan CH
-                arah_gerak_ch_value = self.arah_angin.get(self.user_input['arah_gerak_ch'], "0")
+                arah_gerak_ch_value = self.arah_gerak_code(self.user_input['arah_gerak_ch'])
                 self.page.locator("div:nth-child(3) > .card > .card-body > #collapse-row-2 > div > div:nth-child(2) > div:nth-child(6) > .ant-select > .ant-select-selection > .ant-select-selection__rendered").click()
                 self.page.locator("div:nth-child(3) > .card > .card-body > #collapse-row-2 > div > div:nth-child(2) > div:nth-child(6) > .ant-select > .ant-select-selection > .ant-select-selection__rendered > .ant-select-search > .ant-select-search__field__wrap > .ant-select-search__field").fill(arah_gerak_ch_value)
 
@@ -534,12 +587,3 @@ class AutoInput:
         except Exception as e:
             logging.error(f"Error clicking Preview button: {e}")
             raise
-
-
-class InputProcessor:
-    def __init__(self):
-        pass
-
-    def process(self, data):
-        # Placeholder for processing logic
-        return data
\ No newline at end of file
@@ -1,6 +1,14 @@
 """
 BMKG code mappings and default configurations.
 """
+import sys
+from types import MappingProxyType
+
+
+def _frozen_table(table):
+    """Bekukan tabel sandi dengan key dan value yang di-intern agar string duplikat berbagi objek."""
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in table.items()})
+
 
 # Observer mappings
 obs = {
@@ -58,7 +66,7 @@ default_user_input = {
     'keadaan_tanah': '0'
 }
 
-ww = {
+ww = _frozen_table({
     "CLD DEV UNK": "00",
     "CLD DECR": "01",
     "CLD UNCH": "02",
@@ -186,9 +194,9 @@ ww = {
     "HEAVY TS NO HA + RA": "97",
     "TS + DS/SS": "98",
     "HEAVY TS + HA": "99"
-}
+})
 
-arah_angin = {
+arah_angin = _frozen_table({
     "STNR": "0",
     "NO CLOUD": "0",
     "NORTH EAST": "1",
@@ -278,9 +286,38 @@ arah_angin = {
     "10": "8",
     "15": "8",
     "20": "8"
-}
+})
+
+
+def _sector(deg):
+    """Sektor arah 1-8 untuk derajat 0-360: tiap sektor 45 derajat berpusat di 45, 90, ..., 360.
+
+    Batas sektor jatuh di x.5 derajat (22.5, 67.5, ...), sama dengan tabel arah_angin
+    (25-65 -> 1, ..., 340-360 dan 5-20 -> 8); utara (0 dan 360) bernilai 8.
+    """
+    return str((deg * 2 + 45) // 90 % 8 or 8)
+
 
-w1w2 = {
+# Lookup cepat arah_angin: derajat numerik diindeks langsung, kunci simbolik lewat dict kecil
+DEG_TO_SECTOR = tuple(_sector(deg) for deg in range(361))
+SYMBOLIC_DIR = MappingProxyType({k: v for k, v in arah_angin.items() if not k.isdigit()})
+
+
+def arah_angin_lookup(value, default="0"):
+    """Kembalikan kode sektor arah untuk nilai derajat atau arah simbolik (mis. "NE", "STNR")."""
+    code = SYMBOLIC_DIR.get(value)
+    if code is not None:
+        return code
+    try:
+        deg = int(value)
+    except (TypeError, ValueError):
+        return default
+    if 0 <= deg <= 360:
+        return DEG_TO_SECTOR[deg]
+    return default
+
+
+w1w2 = _frozen_table({
     "CLOUDY -": "0",
     "CLOUDY ±": "1",
     "CLOUDY +": "2",
@@ -295,9 +332,9 @@ w1w2 = {
     "SH": "8",
     "TS": "9",
     "THUNDERSTORM": "9"
-}
+})
 
-ci = {
+ci = _frozen_table({
     "CU": "1",
     "Cu": "2",
     "Cb": "3",
@@ -310,24 +347,24 @@ ci = {
     "CB/SC": "9",
     "CB/CU/SC": "9",
     "CB/SC/CU": "9"
-}
+})
 
-cm = {
+cm = _frozen_table({
     "AS": "1",
     "As": "2",
     "AC": "3",
     "Ac": "4",
     "AC/AS": "7",
     "AS/AC": "7"
-}
+})
 
-ch = {
+ch = _frozen_table({
     "CI": "1",
     "Ci": "2",
     "CS": "7",
     "Cs": "8",
     "CC": "9"
-}
+})
 
 awan_lapisan = {
     "CI": "- cirrus (Ci)",
@@ -2,6 +2,23 @@ import pandas as pd
 from .sandi import default_user_input
 
 
+def read_input_file(file_path, sheet_name=None):
+    """
+    Baca file input (Excel atau CSV) menjadi DataFrame.
+
+    Args:
+        file_path (str): Path ke file (Excel atau CSV).
+        sheet_name (str): Nama sheet untuk file Excel.
+
+    Returns:
+        pd.DataFrame: Isi file input.
+    """
+    # Tentukan format file (CSV atau Excel)
+    if file_path.endswith('.csv'):
+        return pd.read_csv(file_path)
+    return pd.read_excel(file_path, sheet_name=sheet_name)
+
+
 class UserInputUpdater:
     def __init__(self, user_input):
         """
@@ -26,12 +43,19 @@ class UserInputUpdater:
             :param file_path:
             :param sheet_name:
         """
-        # Tentukan format file (CSV atau Excel)
-        if file_path.endswith('.csv'):
-            data = pd.read_csv(file_path)
-        else:
-            data = pd.read_excel(file_path, sheet_name=sheet_name)
+        return self.update_from_data(read_input_file(file_path, sheet_name), jam_terpilih)
+
+    def update_from_data(self, data, jam_terpilih):
+        """
+        Update user_input dari DataFrame yang sudah dibaca berdasarkan jam terpilih.
 
+        Args:
+            data (pd.DataFrame): Isi sheet input, misalnya hasil read_input_file().
+            jam_terpilih (int): Jam pengamatan yang ingin diperbarui.
+
+        Returns:
+            dict: Dictionary user_input yang sudah diperbarui.
+        """
         # Cari baris yang sesuai dengan jam terpilih
         row = data[data['Jam'] == jam_terpilih]
 
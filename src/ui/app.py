@@ -11,10 +11,13 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QPalette, QColor
 from ..core.browsermanager import BrowserManager
 from ..core.fileprocessor import FileProcessor
-from ..utils import get_logger
+from ..utils import get_logger, ensure_logging
 
 logger = get_logger(__name__)
 
+# Direktori profil browser persisten, dihitung sekali saat import
+USER_DATA_DIR = os.path.join(os.path.expanduser("~"), "bmkg_browser_data")
+
 class WorkerThread(QThread):
     finished = pyqtSignal()
     error = pyqtSignal(str)
@@ -106,9 +109,9 @@ class ModernApp(QMainWindow):
             }
         """)
         
-        user_data_dir = os.path.join(os.path.expanduser("~"), "bmkg_browser_data")
-        self.browser_manager = BrowserManager(user_data_dir)
+        self.browser_manager = BrowserManager(USER_DATA_DIR)
         self.worker = None
+        self._browser_ready = False
         self.file_path = None
         self.hour_selected = 0
         self.setup_ui()
@@ -263,6 +266,7 @@ class ModernApp(QMainWindow):
         self.status_label.setText(status)
 
     def browser_ready(self):
+        self._browser_ready = True
         self.status_label.setText("Browser ready!")
 
     def disable_all_buttons(self):
@@ -273,23 +277,30 @@ class ModernApp(QMainWindow):
         self.time_combo.setEnabled(False)
 
     def update_button_states(self):
-        # Enable Open Browser always
-        self.open_browser_btn.setEnabled(True)
-        # Enable Reload Browser if browser is open
-        self.reload_browser_btn.setEnabled(self.browser_manager.page is not None)
-        # Enable Run if file is selected and browser is open
-        self.run_btn.setEnabled(self.file_path is not None and self.browser_manager.page is not None)
-        # Enable file select always
-        self.select_file_btn.setEnabled(True)
-        # Enable time selection always
-        self.time_combo.setEnabled(True)
+        # Coalesce the repaints of all buttons into one
+        self.setUpdatesEnabled(False)
+        try:
+            # Enable Open Browser always
+            self.open_browser_btn.setEnabled(True)
+            # Enable Reload Browser if browser is open
+            self.reload_browser_btn.setEnabled(self._browser_ready)
+            # Enable Run if file is selected and browser is open
+            self.run_btn.setEnabled(self.file_path is not None and self._browser_ready)
+            # Enable file select always
+            self.select_file_btn.setEnabled(True)
+            # Enable time selection always
+            self.time_combo.setEnabled(True)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def closeEvent(self, event):
+        self._browser_ready = False
         if self.browser_manager:
             self.browser_manager.close_browser()
         event.accept()
 
 def main():
+    ensure_logging()
     app = QApplication(sys.argv)
     window = ModernApp()
     window.show()
@@ -2,17 +2,20 @@
 METAR tab UI component.
 """
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
+    QWidget, QVBoxLayout,
     QPushButton, QLabel, QTextEdit, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 import logging
-from ..core.metar_reader import MetarReader
-from ..core.metar_processor import MetarProcessor
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from ..core.metar_reader import METAR_SHAPE_PATTERN
+from .widgets import group_box
 
 logger = logging.getLogger(__name__)
 
+VALIDATION_DELAY_MS = 350
+# "METAR WAAA 010500Z " plus at least one group
+MIN_METAR_LENGTH = 20
+
 class MetarTab(QWidget):
     """METAR tab widget for processing METAR codes."""
     
@@ -26,6 +29,7 @@ class MetarTab(QWidget):
         """
         super().__init__()
         self.browser_manager = browser_manager
+        self._last_status = ""
         self.setup_ui()
         
     def setup_ui(self):
@@ -35,59 +39,51 @@ class MetarTab(QWidget):
         layout.setContentsMargins(20, 20, 20, 20)
 
         # METAR Input Group
-        input_group = QGroupBox("METAR Input")
-        input_layout = QVBoxLayout()
-        
         # Help text
         help_text = (
             "Enter METAR code below. Example format:\n"
-            "WAAA 010500Z 12008KT 9999 FEW018CB SCT025 32/26 Q1008 NOSIG"
+            "METAR WAAA 010500Z 12008KT 9999 FEW018CB SCT025 32/26 Q1008 NOSIG"
         )
         help_label = QLabel(help_text)
-        help_label.setStyleSheet("color: #666666;")
-        input_layout.addWidget(help_label)
+        help_label.setObjectName("hint")
         
         # METAR input field
         self.metar_input = QTextEdit()
         self.metar_input.setPlaceholderText("Enter METAR code here...")
         self.metar_input.setMinimumHeight(100)
-        input_layout.addWidget(self.metar_input)
-        
-        input_group.setLayout(input_layout)
-        layout.addWidget(input_group)
 
-        # Control buttons group
+        # Validation hint, refreshed once typing pauses
+        self.validation_label = QLabel("")
+        self.validation_label.setObjectName("hint")
+
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(VALIDATION_DELAY_MS)
+        self._validate_timer.timeout.connect(self._validate_input)
+        self.metar_input.textChanged.connect(self._validate_timer.start)
+
         reminder_text = (
             "Pastika Kamu Sudah Berada Pada Halaman METAR \n"
             "https://bmkgsatu.bmkg.go.id/meteorologi/metarspeci"
         )
-        control_group = QGroupBox("Controls")
-        control_layout = QHBoxLayout()
-        
+        reminder_label = QLabel(reminder_text)
+        reminder_label.setObjectName("hint")
+        layout.addWidget(group_box("METAR Input", [
+            help_label, self.metar_input, self.validation_label, reminder_label
+        ]))
+
+        # Control buttons group
         self.process_btn = QPushButton("Process METAR")
         self.process_btn.setObjectName("success")
         self.process_btn.clicked.connect(self.process_metar)
         self.process_btn.setMinimumHeight(50)
-        control_layout.addWidget(self.process_btn)
-
-        reminder_text = QLabel(reminder_text)
-        reminder_text.setStyleSheet("color: #666666;")
-        input_layout.addWidget(reminder_text)
-
-        control_group.setLayout(control_layout)
-        layout.addWidget(control_group)
+        layout.addWidget(group_box("Controls", [self.process_btn], horizontal=True))
 
         # Status group
-        status_group = QGroupBox("Status")
-        status_layout = QVBoxLayout()
-        
         self.status_label = QLabel("Ready")
         self.status_label.setObjectName("progressLabel")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        status_layout.addWidget(self.status_label)
-        
-        status_group.setLayout(status_layout)
-        layout.addWidget(status_group)
+        layout.addWidget(group_box("Status", [self.status_label]))
 
         # Add stretch to push everything to the top
         layout.addStretch()
@@ -96,20 +92,35 @@ class MetarTab(QWidget):
         """Reset the UI to its initial state."""
         self.process_btn.setEnabled(True)
         self.status_label.setText("Ready for next METAR input")
+        self._last_status = ""
         # Don't clear the input text to allow the user to retry with the same METAR
 
+    def _validate_input(self):
+        """Run a cheap format check on the METAR input after typing pauses."""
+        metar_code = self.metar_input.toPlainText().strip()
+        if not metar_code:
+            self.validation_label.setText("")
+        elif METAR_SHAPE_PATTERN.match(metar_code):
+            self.validation_label.setText("Format METAR terlihat valid")
+        else:
+            self.validation_label.setText("Format METAR tidak dikenali (contoh: METAR WAAA 010500Z ...)")
+
     def process_metar(self):
-        """Process the entered METAR code."""
+        """Send the entered METAR code to the worker thread for parsing."""
         try:
             metar_code = self.metar_input.toPlainText().strip()
             if not metar_code:
                 QMessageBox.warning(self, "No Input", "Please enter a METAR code.")
                 return
 
-            # Parse METAR code
-            self.status_label.setText("Parsing METAR code...")
-            reader = MetarReader(metar_code)
-            metar_data = reader.parse()
+            # Reject obviously malformed input before a worker round trip and full parse
+            if len(metar_code) < MIN_METAR_LENGTH or not METAR_SHAPE_PATTERN.match(metar_code):
+                QMessageBox.warning(
+                    self,
+                    "Invalid METAR",
+                    "METAR code is too short or does not start with 'METAR <ICAO> <DDHHMM>Z'."
+                )
+                return
 
             # Get the worker thread from the parent window
             parent_window = self.window()
@@ -121,51 +132,57 @@ class MetarTab(QWidget):
             # Disable the process button while processing
             self.process_btn.setEnabled(False)
 
-            # Send the METAR processing command to the worker thread
-            parent_window.worker_thread.send_command('process_metar', {'metar_data': metar_data})
+            # Parsing runs in the worker thread; metar_parsed() continues with form filling
+            self.status_label.setText("Parsing METAR code...")
+            self._last_status = ""
+            parent_window.worker_thread.send_command('parse_metar', {'metar_code': metar_code})
 
-        except ValueError as e:
-            logger.error(f"Invalid METAR code: {e}")
-            QMessageBox.critical(self, "Error", f"Invalid METAR code: {str(e)}")
-            self.reset_to_initial_state()
-        except PlaywrightTimeoutError as e:
-            logger.warning(f"Timeout occurred while processing METAR: {e}")
-            self.status_label.setText("Timeout occurred - system ready for next input")
-            self.reset_to_initial_state()
         except Exception as e:
             logger.error(f"Error processing METAR: {e}")
             QMessageBox.critical(self, "Error", f"Error processing METAR: {str(e)}")
             self.reset_to_initial_state()
 
+    def metar_parsed(self, metar_data: dict):
+        """Send parsed METAR data to the worker thread for form filling.
+
+        Args:
+            metar_data: Parsed METAR data emitted by the worker thread
+        """
+        parent_window = self.window()
+        if not parent_window or not hasattr(parent_window, 'worker_thread'):
+            self.reset_to_initial_state()
+            return
+        parent_window.worker_thread.send_command('process_metar', {'metar_data': metar_data})
+
+    def metar_processed(self):
+        """Re-enable input after the worker finished filling the METAR form."""
+        self.process_btn.setEnabled(True)
+        self.metar_input.clear()  # Clear input after successful processing
+
     def update_status(self, message: str):
         """Update the status label with a message.
         
         Args:
             message: Status message to display
         """
+        # Skip repeated messages so the label and log are not churned
+        if message == self._last_status:
+            return
+        self._last_status = message
         self.status_label.setText(message)
-        logger.info(message)
         
-        # Handle different message types
-        if "METAR processed successfully" in message:
-            self.process_btn.setEnabled(True)
-            self.metar_input.clear()  # Clear input after successful processing
-        elif "Error" in message or "Timeout" in message:
-            # Show a more user-friendly message for timeouts
+        # Success is signalled through metar_processed(); only failures are sniffed here
+        if "Error" in message or "Timeout" in message:
+            # Show the timeout dialog after this slot returns so progress updates keep flowing
             if "Timeout" in message:
-                QMessageBox.warning(
-                    self,
-                    "Timeout Error",
-                    "The operation timed out. The system has been reset and is ready for your next METAR input.\n\n"
-                    "You can try again with the same METAR code."
-                )
-            self.reset_to_initial_state() 
-            # Show a more user-friendly message for timeouts
-            if "Timeout" in message:
-                QMessageBox.warning(
-                    self,
-                    "Timeout Error",
-                    "The operation timed out. The system has been reset and is ready for your next METAR input.\n\n"
-                    "You can try again with the same METAR code."
-                )
-            self.reset_to_initial_state() 
\ No newline at end of file
+                QTimer.singleShot(0, self._show_timeout_warning)
+            self.reset_to_initial_state()
+
+    def _show_timeout_warning(self):
+        """Show a user-friendly message for timeouts."""
+        QMessageBox.warning(
+            self,
+            "Timeout Error",
+            "The operation timed out. The system has been reset and is ready for your next METAR input.\n\n"
+            "You can try again with the same METAR code."
+        )
\ No newline at end of file
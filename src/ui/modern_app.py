@@ -3,45 +3,84 @@ Modern UI implementation for BMKG Auto Input menggunakan PyQt6.
 """
 import sys
 import os
-import logging
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QComboBox, QMessageBox,
-    QProgressBar, QFrame, QScrollArea, QGroupBox, QCheckBox,
     QTabWidget
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSettings
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
-from ..core import AutoInput, BrowserManager
-from ..data import obs, ww, w1w2, ci, awan_lapisan, arah_angin, cm, ch, default_user_input, UserInputUpdater
-from ..utils import get_logger
-from ..auto_sender import AutoSender
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSettings, QObject, QRunnable, QThreadPool, QTimer
+from PyQt6.QtGui import QIcon
+from ..utils import get_logger, ensure_logging
 from .metar_tab import MetarTab
-import queue
+from .widgets import group_box
+import threading
 import time
+from collections import ChainMap, deque
+from functools import lru_cache
 
 # Configure logging
 logger = get_logger(__name__)
 error_logger = get_logger('error')  # Get the error-specific logger
 
+# Direktori profil browser persisten, dihitung sekali saat import
+USER_DATA_DIR = os.path.join(os.path.expanduser("~"), "bmkg_browser_data")
+
+# Ikon aplikasi; dicek sekali saat import, QIcon dibuat setelah QApplication ada
+_ICON_PATH = Path(__file__).with_name("assets") / "BMKG.ico"
+if not _ICON_PATH.exists():
+    _ICON_PATH = None
+
+# Lama pesan sukses/info tampil di status bar (ms)
+STATUS_MESSAGE_MS = 3000
+
+# Batas waktu menunggu worker menutup browser saat jendela ditutup (ms)
+CLOSE_TIMEOUT_MS = 5000
+
+# Pesan progress dari worker digabung dan ditampilkan paling sering sekali per interval ini (ms)
+STATUS_FLUSH_MS = 50
+
+# Jumlah hasil parsing Excel (per path, mtime, jam) yang disimpan
+EXCEL_CACHE_SIZE = 8
+
+# Jenis halaman browser untuk tiap tab, urut sesuai indeks tab
+_TAB_PAGE_TYPES = ('auto_input', 'metar')
+
+# Label jam pengamatan untuk combo box waktu
+_HOUR_LABELS = tuple(f"{h:02d}:00" for h in range(24))
+
+# Stylesheet jendela utama (assets/style.qss), dibaca sekali saat import
+_STYLESHEET = (Path(__file__).with_name("assets") / "style.qss").read_text(encoding="utf-8")
+
 class FileHandler:
     """Handles file operations and validation."""
     
     @staticmethod
-    def validate_file_path(file_path: str) -> None:
-        """Validate if the file path exists and is accessible."""
-        if not file_path or not os.path.exists(file_path):
+    def validate_file_path(file_path: str) -> os.stat_result:
+        """Validate if the file path exists and is accessible.
+
+        Returns the file's stat result so callers can reuse st_mtime.
+        """
+        try:
+            st = os.stat(file_path) if file_path else None
+        except OSError:
+            st = None
+        if st is None:
             error_logger.error(f"File not found: {file_path}")
             raise FileNotFoundError(f"File {file_path} not found.")
         
         if not os.access(file_path, os.R_OK):
             error_logger.error(f"No permission to read file: {file_path}")
             raise PermissionError(f"No permission to read file: {file_path}")
+        return st
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def ensure_directory_exists(directory: str) -> str:
-        """Ensure the directory exists, create if it doesn't."""
+        """Ensure the directory exists, create if it doesn't.
+
+        Results are memoized per path, so later calls skip the mkdir syscall.
+        """
         try:
             path = Path(directory)
             path.mkdir(parents=True, exist_ok=True)
@@ -50,12 +89,64 @@ class FileHandler:
             error_logger.error(f"Failed to create directory {directory}: {str(e)}")
             raise
 
+class ExcelLoadSignals(QObject):
+    """Signals emitted by ExcelLoadTask back to the GUI thread."""
+
+    loaded = pyqtSignal(object, object, object)
+    failed = pyqtSignal(str)
+
+
+class ExcelLoadTask(QRunnable):
+    """One-shot Excel parse run on QThreadPool, outside the browser worker."""
+
+    def __init__(self, file_path, selected_time, key, sheet=None):
+        """Initialize the task.
+
+        Args:
+            file_path: Path to the input workbook
+            selected_time: Observation hour to extract
+            key: Cache key (path, mtime, hour) passed back with the result
+            sheet: Previously read DataFrame for the same (path, mtime), if any
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.selected_time = selected_time
+        self.key = key
+        self.sheet = sheet
+        self.signals = ExcelLoadSignals()
+
+    def run(self):
+        from ..data import default_user_input, UserInputUpdater, read_input_file
+        try:
+            # Workbook hanya dibaca ulang bila path atau mtime berubah
+            if self.sheet is None:
+                self.sheet = read_input_file(self.file_path, "input_data")
+            # Nilai dari Excel ditulis ke map depan; default dibaca tanpa disalin
+            updater = UserInputUpdater(ChainMap({}, default_user_input))
+            user_input = updater.update_from_data(self.sheet, self.selected_time)
+            self.signals.loaded.emit(self.key, user_input, self.sheet)
+        except Exception as e:
+            error_logger.error(f"Failed to read Excel file {self.file_path}: {e}")
+            self.signals.failed.emit(str(e))
+
+
 class PersistentWorkerThread(QThread):
     """Worker thread for handling browser operations."""
     
     progress = pyqtSignal(str)
-    finished = pyqtSignal(str)
+    # Named so it does not shadow QThread.finished, which reports the thread's exit
+    command_done = pyqtSignal(str)
     error = pyqtSignal(str)
+    metar_parsed = pyqtSignal(dict)
+
+    # Perintah yang aman digabung bila terkirim berturut-turut
+    IDEMPOTENT_COMMANDS = frozenset({'open', 'reload', 'navigate'})
+    # Batas antrean perintah dari UI
+    MAX_PENDING_COMMANDS = 8
+    # Perintah yang tidak boleh hilang karena antrean penuh (seperti sentinel shutdown)
+    UNBOUNDED_COMMANDS = frozenset({'close', 'stop_auto_send'})
+    # Tab browser diganti baru setelah sekian kali isi form agar memori renderer tidak menumpuk
+    FILLS_PER_PAGE = 50
 
     def __init__(self, user_data_dir):
         """Initialize the worker thread.
@@ -65,135 +156,246 @@ class PersistentWorkerThread(QThread):
         """
         super().__init__()
         self.user_data_dir = user_data_dir
-        self.command_queue = queue.Queue()
+        # Antrean perintah dari UI; event di-set setiap ada perintah baru
+        self._commands = deque()
+        self._command_ready = threading.Event()
+        self._last_enqueued = None
         self.browser_manager = None
         self.running = True
         self.auto_sender = None
         self.auto_send_running = False
+        self.metar_processor = None
+        self.auto_input = None
+        self._fills_on_page = 0
+        # time.monotonic() deadline of the next auto-send step
+        self._auto_send_due = None
+        # Progress is logged in the emitting (worker) thread, not in the GUI slots
+        self.progress.connect(logger.info, Qt.ConnectionType.DirectConnection)
         logger.info("PersistentWorkerThread initialized")
 
     def run(self):
         """Main worker thread loop."""
+        # Playwright dan modul core baru dimuat saat worker mulai berjalan
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         from ..core import BrowserManager
+        from ..core.metar_reader import parse_metar
+        from ..auto_sender import AutoSender
         while self.running:
-            try:
-                command, args = self.command_queue.get(timeout=0.1)
-            except queue.Empty:
-                # Check if auto-send is running and needs to continue
-                if self.auto_send_running and self.auto_sender:
-                    try:
-                        # Only start if not already running
-                        if not self.auto_sender.state.is_running:
-                            self.auto_sender.start()
-                            self.progress.emit("Auto-send process started and waiting for next hour")
-                    except Exception as e:
-                        error_logger.error(f"Error in auto-send: {str(e)}")
-                        self.error.emit(f"Error in auto-send: {str(e)}")
-                        self.auto_send_running = False
-                        self.auto_sender = None
-                continue
-
-            try:
-                if command == 'open':
-                    if not self.browser_manager:
-                        self.progress.emit("Opening browser...")
-                        self.browser_manager = BrowserManager(user_data_dir=self.user_data_dir)
-                        page_type = args.get('page_type', 'auto_input')
-                        self.browser_manager.start_browser(page_type)
-                        self.progress.emit("Browser opened and page loaded!")
-                        self.finished.emit('open')
-                    else:
-                        # If browser is already open, navigate to the requested page
-                        page_type = args.get('page_type', 'auto_input')
-                        self.browser_manager.navigate_to_page(page_type)
-                        self.progress.emit("Browser already open, navigated to requested page.")
-                        self.finished.emit('open')
-                elif command == 'process_metar':
-                    if not self.browser_manager:
-                        error_logger.error("Browser not open when attempting to process METAR")
-                        self.error.emit("Browser not open. Please open the browser first.")
-                        continue
+            # Sleep until a command arrives (or the next auto-send step is due),
+            # then drain everything that is already queued
+            if self._command_ready.wait(self._auto_send_timeout()):
+                batch = []
+            else:
+                batch = [('auto_send', {})]
+            self._command_ready.clear()
+            while self._commands:
+                batch.append(self._commands.popleft())
+
+            for command, args in self._coalesce(batch):
+                if command == 'shutdown':
+                    self.running = False
+                    break
+                try:
+                    if command == 'open':
+                        if not self.browser_manager:
+                            self.progress.emit("Opening browser...")
+                            self.browser_manager = BrowserManager(user_data_dir=self.user_data_dir)
+                            self._fills_on_page = 0
+                            page_type = args.get('page_type', 'auto_input')
+                            self.browser_manager.start_browser(page_type)
+                            self.progress.emit("Browser opened and page loaded!")
+                            self.command_done.emit('open')
+                        else:
+                            # If browser is already open, navigate to the requested page
+                            page_type = args.get('page_type', 'auto_input')
+                            self.browser_manager.navigate_to_page(page_type)
+                            self.progress.emit("Browser already open, navigated to requested page.")
+                            self.command_done.emit('open')
+                    elif command == 'navigate':
+                        if self.browser_manager is None:
+                            continue
+                        self.browser_manager.navigate_to_page(args.get('page_type', 'auto_input'))
+                    elif command == 'parse_metar':
+                        try:
+                            metar_data = parse_metar(args.get('metar_code', ''))
+                        except ValueError as e:
+                            error_logger.error(f"Invalid METAR code: {e}")
+                            self.error.emit(f"Invalid METAR code: {str(e)}")
+                            continue
+                        self.metar_parsed.emit(metar_data)
+                    elif command == 'process_metar':
+                        if not self.browser_manager:
+                            error_logger.error("Browser not open when attempting to process METAR")
+                            self.error.emit("Browser not open. Please open the browser first.")
+                            continue
                         
-                    metar_data = args.get('metar_data')
-                    if not metar_data:
-                        self.error.emit("No METAR data provided")
-                        continue
+                        metar_data = args.get('metar_data')
+                        if not metar_data:
+                            self.error.emit("No METAR data provided")
+                            continue
                         
-                    self.progress.emit("Processing METAR data...")
-                    try:
-                        from ..core.metar_processor import MetarProcessor
-                        processor = MetarProcessor(self.browser_manager.page)
-                        processor.fill_form(metar_data)
-                        self.progress.emit("METAR processed successfully!")
-                        self.finished.emit('process_metar')
-                    except PlaywrightTimeoutError as e:
-                        error_msg = f"Timeout while processing METAR: {str(e)}"
-                        error_logger.warning(error_msg)  # Use warning instead of error for timeouts
-                        self.error.emit(error_msg)
-                        # Don't raise the error - let the UI handle it gracefully
-                    except Exception as e:
-                        error_msg = f"Error processing METAR: {str(e)}"
-                        error_logger.error(error_msg)
-                        self.error.emit(error_msg)
-                elif command == 'fill':
-                    user_input = args.get('user_input')
-                    if self.browser_manager is None:
-                        error_logger.error("Browser not open when attempting to fill form")
-                        self.error.emit("Browser not open. Please open the browser first.")
-                        continue
-                    self.progress.emit("Filling form...")
-                    from ..core import AutoInput
-                    from ..data import obs, ww, w1w2, ci, awan_lapisan, arah_angin, cm, ch
-                    auto_input = AutoInput(
-                        self.browser_manager.page,
-                        user_input,
-                        obs, ww, w1w2, awan_lapisan, arah_angin, ci, cm, ch
-                    )
-                    auto_input.fill_form()
-                    self.progress.emit("Form filled successfully!")
-                    self.finished.emit('fill')
-                elif command == 'reload':
-                    if self.browser_manager is None:
-                        error_logger.error("Browser not open when attempting to reload")
-                        self.error.emit("Browser not open. Please open the browser first.")
-                        continue
-                    self.progress.emit("Refreshing page...")
-                    self.browser_manager.reload_page()
-                    self.progress.emit("Page refreshed successfully!")
-                    self.finished.emit('reload')
-                elif command == 'start_auto_send':
-                    if self.browser_manager is None:
-                        error_logger.error("Browser not open when attempting to start auto-send")
-                        self.error.emit("Browser not open. Please open the browser first.")
-                        continue
-                    # Make sure we're on the auto_input page for auto-send
-                    self.browser_manager.navigate_to_page('auto_input')
-                    from ..auto_sender import AutoSender
-                    # Create new instance each time
-                    self.auto_sender = AutoSender(
-                        page=self.browser_manager.page,
-                        progress_callback=self.progress.emit
-                    )
-                    self.auto_send_running = True
-                    self.progress.emit("Auto-send started")
-                    self.finished.emit('start_auto_send')
-                elif command == 'stop_auto_send':
-                    if self.auto_sender:
-                        self.auto_sender.stop()
-                        self.auto_sender = None
-                    self.auto_send_running = False
-                    self.progress.emit("Auto-send stopped")
-                    self.finished.emit('stop_auto_send')
-                elif command == 'close':
-                    if self.browser_manager:
-                        self.browser_manager.stop_browser()
-                        self.browser_manager = None
-                    self.running = False
-                    self.progress.emit("Browser closed.")
-                    self.finished.emit('close')
-            except Exception as e:
-                error_logger.error(f"Error in worker thread: {str(e)}", exc_info=True)
-                self.error.emit(str(e))
+                        self.progress.emit("Processing METAR data...")
+                        try:
+                            self._get_metar_processor().fill_form(metar_data)
+                            self.progress.emit("METAR processed successfully!")
+                            self.command_done.emit('process_metar')
+                        except PlaywrightTimeoutError as e:
+                            error_msg = f"Timeout while processing METAR: {str(e)}"
+                            error_logger.warning(error_msg)  # Use warning instead of error for timeouts
+                            self.error.emit(error_msg)
+                            # Don't raise the error - let the UI handle it gracefully
+                        except Exception as e:
+                            error_msg = f"Error processing METAR: {str(e)}"
+                            error_logger.error(error_msg)
+                            self.error.emit(error_msg)
+                    elif command == 'fill':
+                        user_input = args.get('user_input')
+                        if self.browser_manager is None:
+                            error_logger.error("Browser not open when attempting to fill form")
+                            self.error.emit("Browser not open. Please open the browser first.")
+                            continue
+                        if self._fills_on_page >= self.FILLS_PER_PAGE:
+                            # Fresh tab in the same persistent context; cookies are kept
+                            self.progress.emit("Recycling browser page...")
+                            self.browser_manager.reopen_page()
+                            self._fills_on_page = 0
+                        self.progress.emit("Filling form...")
+                        auto_input = self._get_auto_input()
+                        auto_input.update_user_input(user_input)
+                        auto_input.fill_form()
+                        self._fills_on_page += 1
+                        self.progress.emit("Form filled successfully!")
+                        self.command_done.emit('fill')
+                    elif command == 'reload':
+                        if self.browser_manager is None:
+                            error_logger.error("Browser not open when attempting to reload")
+                            self.error.emit("Browser not open. Please open the browser first.")
+                            continue
+                        self.progress.emit("Refreshing page...")
+                        self.browser_manager.reload_page()
+                        self.progress.emit("Page refreshed successfully!")
+                        self.command_done.emit('reload')
+                    elif command == 'start_auto_send':
+                        if self.browser_manager is None:
+                            error_logger.error("Browser not open when attempting to start auto-send")
+                            self.error.emit("Browser not open. Please open the browser first.")
+                            # Auto-send is not running; let the UI re-enable Start
+                            self.command_done.emit('stop_auto_send')
+                            continue
+                        # Make sure we're on the auto_input page for auto-send
+                        self.browser_manager.navigate_to_page('auto_input')
+                        # Create new instance each time, ending any previous run
+                        if self.auto_sender:
+                            self.auto_sender.stop()
+                        self.auto_sender = AutoSender(
+                            page=self.browser_manager.page,
+                            config=args.get('config'),
+                            progress_callback=self.progress.emit
+                        )
+                        self.auto_send_running = True
+                        self.progress.emit("Auto-send started")
+                        self._schedule_auto_send(self.auto_sender.begin())
+                        self.command_done.emit('start_auto_send')
+                    elif command == 'auto_send':
+                        self._run_auto_send()
+                    elif command == 'stop_auto_send':
+                        if self.auto_sender:
+                            self.auto_sender.stop()
+                            self.auto_sender = None
+                        self.auto_send_running = False
+                        self._schedule_auto_send(None)
+                        self.progress.emit("Auto-send stopped")
+                        self.command_done.emit('stop_auto_send')
+                    elif command == 'close':
+                        # Closing also ends auto-send; the browser it drives is going away
+                        if self.auto_sender:
+                            self.auto_sender.stop()
+                            self.auto_sender = None
+                        self.auto_send_running = False
+                        self._schedule_auto_send(None)
+                        if self.browser_manager:
+                            self.browser_manager.stop_browser()
+                            self.browser_manager = None
+                        self.progress.emit("Browser closed.")
+                        self.command_done.emit('close')
+                except Exception as e:
+                    error_logger.error(f"Error in worker thread: {str(e)}", exc_info=True)
+                    self.error.emit(str(e))
+
+    @classmethod
+    def _coalesce(cls, batch):
+        """Drop repeated idempotent commands (open/reload) that follow each other.
+
+        A pending 'close' pre-empts the rest of the batch: only it and a
+        trailing 'shutdown' are kept, so closing never waits behind queued work.
+        """
+        closes = [item for item in batch if item[0] == 'close']
+        if closes:
+            return closes[:1] + [item for item in batch if item[0] == 'shutdown'][:1]
+        commands = []
+        for command, args in batch:
+            if (command in cls.IDEMPOTENT_COMMANDS
+                    and commands and commands[-1] == (command, args)):
+                continue
+            commands.append((command, args))
+        return commands
+
+    def _auto_send_timeout(self):
+        """Seconds until the next auto-send step, or None when nothing is scheduled."""
+        if self._auto_send_due is None:
+            return None
+        return max(0.0, self._auto_send_due - time.monotonic())
+
+    def _schedule_auto_send(self, delay):
+        """Schedule the next auto-send step in `delay` seconds; None cancels it."""
+        self._auto_send_due = None if delay is None else time.monotonic() + delay
+
+    def _run_auto_send(self):
+        """Run one auto-send step; commands are handled between steps."""
+        if not (self.auto_send_running and self.auto_sender and self.auto_sender.state.is_running):
+            self._schedule_auto_send(None)
+            return
+        try:
+            self._schedule_auto_send(self.auto_sender.tick())
+        except Exception as e:
+            error_logger.error(f"Error in auto-send: {str(e)}")
+            self.error.emit(f"Error in auto-send: {str(e)}")
+            self.auto_sender.stop()
+            self.auto_send_running = False
+            self.auto_sender = None
+            self._schedule_auto_send(None)
+            self.command_done.emit('stop_auto_send')
+
+    def shutdown(self):
+        """Ask the worker loop to exit once the queued commands are handled."""
+        # The sentinel bypasses MAX_PENDING_COMMANDS so it is never dropped
+        self._commands.append(('shutdown', None))
+        self._command_ready.set()
+
+    def _get_auto_input(self):
+        """Return the cached AutoInput, rebinding it if the browser page changed."""
+        page = self.browser_manager.page
+        if self.auto_input is None:
+            from ..core import AutoInput
+            from ..data import obs, ww, w1w2, ci, awan_lapisan, arah_angin, cm, ch
+            self.auto_input = AutoInput(
+                page,
+                None,
+                obs, ww, w1w2, awan_lapisan, arah_angin, ci, cm, ch
+            )
+        elif self.auto_input.page is not page:
+            self.auto_input.page = page
+        return self.auto_input
+
+    def _get_metar_processor(self):
+        """Return the cached MetarProcessor, rebinding it if the browser page changed."""
+        page = self.browser_manager.page
+        if self.metar_processor is None:
+            from ..core.metar_processor import MetarProcessor
+            self.metar_processor = MetarProcessor(page)
+        elif self.metar_processor.page is not page:
+            self.metar_processor.page = page
+        return self.metar_processor
 
     def send_command(self, command, args=None):
         """Send a command to the worker thread.
@@ -204,11 +406,23 @@ class PersistentWorkerThread(QThread):
         """
         if not self.running:
             return
-        self.command_queue.put((command, args or {}))
+        item = (command, args or {})
+        # Skip a repeated open/reload while the previous one is still pending
+        if (command in self.IDEMPOTENT_COMMANDS and item == self._last_enqueued
+                and self._commands):
+            logger.info(f"Skipping duplicate '{command}' command")
+            return
+        if (len(self._commands) >= self.MAX_PENDING_COMMANDS
+                and command not in self.UNBOUNDED_COMMANDS):
+            logger.warning(f"Command queue full, dropping '{command}'")
+            return
+        self._commands.append(item)
+        self._last_enqueued = item
+        self._command_ready.set()
 
     def cleanup(self):
         """Clean up resources before thread termination."""
-        self.running = False
+        self.shutdown()
         if self.browser_manager:
             try:
                 self.browser_manager.stop_browser()
@@ -226,145 +440,23 @@ class ModernApp(QMainWindow):
         self.setGeometry(100, 100, 400, 600)
         
         # Set application icon
-        icon_path = os.path.join(os.path.dirname(__file__), "assets", "BMKG.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if _ICON_PATH is not None:
+            self.setWindowIcon(QIcon(str(_ICON_PATH)))
         
         # Apply the existing stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #1a237e;
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding: 15px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 5px;
-                color: #1a237e;
-            }
-            QPushButton {
-                padding: 10px 20px;
-                border-radius: 5px;
-                min-width: 120px;
-                font-weight: bold;
-            }
-            QPushButton#primary {
-                background-color: #1a237e;
-                color: white;
-                border: none;
-            }
-            QPushButton#primary:hover {
-                background-color: #283593;
-            }
-            QPushButton#primary:disabled {
-                background-color: #9e9e9e;
-                color: #e0e0e0;
-                border: none;
-            }
-            QPushButton#success {
-                background-color: #2e7d32;
-                color: white;
-                border: none;
-            }
-            QPushButton#success:hover {
-                background-color: #388e3c;
-            }
-            QPushButton#success:disabled {
-                background-color: #9e9e9e;
-                color: #e0e0e0;
-                border: none;
-            }
-            QPushButton#warning {
-                background-color: #f57c00;
-                color: white;
-                border: none;
-            }
-            QPushButton#warning:hover {
-                background-color: #fb8c00;
-            }
-            QPushButton#warning:disabled {
-                background-color: #9e9e9e;
-                color: #e0e0e0;
-                border: none;
-            }
-            QPushButton:disabled {
-                background-color: #9e9e9e;
-                color: #e0e0e0;
-                border: none;
-            }
-            QComboBox {
-                padding: 8px;
-                border: 2px solid #1a237e;
-                border-radius: 5px;
-                min-width: 120px;
-                background-color: white;
-            }
-            QComboBox:hover {
-                border-color: #283593;
-            }
-            QProgressBar {
-                border: 2px solid #1a237e;
-                border-radius: 5px;
-                text-align: justify;
-                height: 25px;
-                background-color: white;
-            }
-            QProgressBar::chunk {
-                background-color: #1a237e;
-                border-radius: 3px;
-            }
-            QLabel {
-                color: #1a237e;
-            }
-            QLabel#progressLabel {
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px;
-                background-color: #f5f5f5;
-                border-radius: 5px;
-                border: 1px solid #1a237e;
-            }
-            QTabWidget::pane {
-                border: 2px solid #1a237e;
-                border-radius: 8px;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #f0f0f0;
-                color: #1a237e;
-                padding: 10px 20px;
-                border: 2px solid #1a237e;
-                border-bottom: none;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                border-bottom: none;
-            }
-            QTabBar::tab:hover {
-                background-color: #e3f2fd;
-            }
-        """)
+        self.setStyleSheet(_STYLESHEET)
         
         # Initialize settings
         self.settings = QSettings('BMKG', 'AutoInput')
         
-        # Initialize browser and worker
-        user_data_dir = os.path.join(os.path.expanduser("~"), "bmkg_browser_data")
-        self.browser_manager = BrowserManager(user_data_dir)
-        self.worker_thread = PersistentWorkerThread(user_data_dir)
-        self.worker_thread.progress.connect(self.update_status)
-        self.worker_thread.finished.connect(self.worker_finished)
-        self.worker_thread.error.connect(self.handle_error)
+        # Initialize worker; it owns the only BrowserManager
+        self.worker_thread = PersistentWorkerThread(USER_DATA_DIR)
+        # Worker signals always cross into the GUI thread; queue them explicitly
+        queued = Qt.ConnectionType.QueuedConnection
+        self.worker_thread.progress.connect(self.update_status, queued)
+        self.worker_thread.command_done.connect(self.worker_finished, queued)
+        self.worker_thread.finished.connect(self._worker_stopped, queued)
+        self.worker_thread.error.connect(self.handle_error, queued)
         self.worker_thread.start()
         
         # Initialize other variables
@@ -373,31 +465,57 @@ class ModernApp(QMainWindow):
         self.auto_sender = None
         self.auto_send_thread = None
         self.browser_opened = False
+        self._closing = False
+        self._close_timer = None
+        # Auto-send state as seen by the GUI: set on click and confirmed by the worker's
+        # command_done once every start/stop request sent so far has been answered
+        self._auto_send_running = False
+        self._auto_send_pending = 0
+        # Hasil parsing Excel, key: (path, mtime, jam)
+        self._excel_cache = {}
+        # Sheet input terakhir yang dibaca: ((path, mtime), DataFrame)
+        self._sheet_cache = None
+        # Pesan progress terbaru yang belum ditampilkan
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_FLUSH_MS)
+        self._status_timer.timeout.connect(self._flush_status)
         
         # Setup UI
         self.setup_ui()
 
     def setup_ui(self):
         central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        layout = QVBoxLayout(central_widget)
-        layout.setSpacing(20)
-        layout.setContentsMargins(20, 20, 20, 20)
-
-        # Create tab widget
-        self.tab_widget = QTabWidget()
-        self.tab_widget.currentChanged.connect(self.handle_tab_change)
-        
-        # Create and add Auto Input tab
-        self.auto_input_tab = QWidget()
-        self.setup_auto_input_tab()
-        self.tab_widget.addTab(self.auto_input_tab, "Auto Input")
-        
-        # Create and add METAR tab
-        self.metar_tab = MetarTab(self.browser_manager)
-        self.tab_widget.addTab(self.metar_tab, "METAR")
-        
-        layout.addWidget(self.tab_widget)
+        # Build the whole widget tree before any repaint or layout pass
+        central_widget.setUpdatesEnabled(False)
+        try:
+            self.setCentralWidget(central_widget)
+            layout = QVBoxLayout(central_widget)
+            layout.setSpacing(20)
+            layout.setContentsMargins(20, 20, 20, 20)
+
+            # Create tab widget
+            self.tab_widget = QTabWidget()
+            self.tab_widget.currentChanged.connect(self.handle_tab_change)
+            
+            # Create and add Auto Input tab
+            self.auto_input_tab = QWidget()
+            self.setup_auto_input_tab()
+            self.tab_widget.addTab(self.auto_input_tab, "Auto Input")
+            
+            # Create and add METAR tab
+            self.metar_tab = MetarTab(self.worker_thread.browser_manager)
+            self.worker_thread.metar_parsed.connect(
+                self.metar_tab.metar_parsed, Qt.ConnectionType.QueuedConnection)
+            self.tab_widget.addTab(self.metar_tab, "METAR")
+            
+            layout.addWidget(self.tab_widget)
+            # Create the status bar up front so the window does not resize on the first message
+            self.statusBar()
+            layout.activate()
+        finally:
+            central_widget.setUpdatesEnabled(True)
 
     def setup_auto_input_tab(self):
         """Set up the Auto Input tab UI."""
@@ -406,44 +524,27 @@ class ModernApp(QMainWindow):
         layout.setContentsMargins(20, 20, 20, 20)
 
         # File selection group
-        file_group = QGroupBox("File Selection")
-        file_layout = QVBoxLayout()
-        
         self.select_file_btn = QPushButton("Select Excel File")
         self.select_file_btn.setObjectName("primary")
         self.select_file_btn.clicked.connect(self.select_file)
-        file_layout.addWidget(self.select_file_btn)
 
         self.file_label = QLabel("No file selected")
-        self.file_label.setStyleSheet("color: #666666;")
-        file_layout.addWidget(self.file_label)
-        
-        file_group.setLayout(file_layout)
-        layout.addWidget(file_group)
+        self.file_label.setObjectName("hint")
+        layout.addWidget(group_box("File Selection", [self.select_file_btn, self.file_label]))
 
         # Time selection group
-        time_group = QGroupBox("Observation Time")
-        time_layout = QVBoxLayout()
-        
-        time_label = QLabel("Select Observation Hour:")
-        time_layout.addWidget(time_label)
-        
         self.time_combo = QComboBox()
-        self.time_combo.addItems([f"{i:02d}:00" for i in range(24)])
+        self.time_combo.addItems(_HOUR_LABELS)
         self.time_combo.currentIndexChanged.connect(self.time_changed)
-        time_layout.addWidget(self.time_combo)
-        
-        time_group.setLayout(time_layout)
-        layout.addWidget(time_group)
+        layout.addWidget(group_box("Observation Time", [
+            QLabel("Select Observation Hour:"),
+            self.time_combo
+        ]))
 
         # Auto Send Control group
-        auto_send_group = QGroupBox("Auto Send Control")
-        auto_send_layout = QVBoxLayout()
-
         # Status label
         self.auto_send_status = QLabel("Auto Send: Tidak Aktif")
-        self.auto_send_status.setStyleSheet("color: #666666;")
-        auto_send_layout.addWidget(self.auto_send_status)
+        self.auto_send_status.setObjectName("hint")
 
         # Control buttons
         auto_send_buttons = QHBoxLayout()
@@ -459,9 +560,7 @@ class ModernApp(QMainWindow):
         self.stop_auto_send_btn.setEnabled(False)
         auto_send_buttons.addWidget(self.stop_auto_send_btn)
 
-        auto_send_layout.addLayout(auto_send_buttons)
-        auto_send_group.setLayout(auto_send_layout)
-        layout.addWidget(auto_send_group)
+        layout.addWidget(group_box("Auto Send Control", [self.auto_send_status, auto_send_buttons]))
 
         # Run Auto Input button
         self.run_btn = QPushButton("Run Auto Input")
@@ -471,51 +570,44 @@ class ModernApp(QMainWindow):
         layout.addWidget(self.run_btn)
 
         # Control buttons group
-        control_group = QGroupBox("Controls")
-        control_layout = QHBoxLayout()
-        
         self.open_browser_btn = QPushButton("Open Browser")
         self.open_browser_btn.setObjectName("primary")
         self.open_browser_btn.clicked.connect(self.open_browser)
-        control_layout.addWidget(self.open_browser_btn)
 
         self.reload_browser_btn = QPushButton("Reload Browser")
         self.reload_browser_btn.setObjectName("primary")
         self.reload_browser_btn.clicked.connect(self.reload_browser)
-        control_layout.addWidget(self.reload_browser_btn)
-        
-        control_group.setLayout(control_layout)
-        layout.addWidget(control_group)
+        layout.addWidget(group_box(
+            "Controls", [self.open_browser_btn, self.reload_browser_btn], horizontal=True
+        ))
 
         # Progress group
-        progress_group = QGroupBox("Status")
-        progress_layout = QVBoxLayout()
-        
         self.status_label = QLabel("Ready")
         self.status_label.setObjectName("progressLabel")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        progress_layout.addWidget(self.status_label)
-        
-        progress_group.setLayout(progress_layout)
-        layout.addWidget(progress_group)
+        layout.addWidget(group_box("Status", [self.status_label]))
 
         self.update_button_states()
 
     def start_auto_send(self):
         """Start the auto-send process."""
         try:
-            # Reset any existing auto-send state
-            if hasattr(self.worker_thread, 'auto_sender'):
-                self.worker_thread.auto_sender = None
-            self.worker_thread.auto_send_running = False
-            
-            self.worker_thread.send_command('start_auto_send')
+            from ..config import AutoSenderConfig
+            # Jeda reload/retry bisa diatur lewat QSettings untuk koneksi yang lambat
+            config = AutoSenderConfig()
+            config.reload_delay = self.settings.value(
+                'auto_send/reload_delay', config.reload_delay, type=int)
+            config.network.retry_interval = self.settings.value(
+                'auto_send/retry_interval', config.network.retry_interval, type=int)
+            self.worker_thread.send_command('start_auto_send', {'config': config})
+            self._auto_send_running = True
+            self._auto_send_pending += 1
             self.auto_send_status.setText("Auto Send: Aktif")
             self.start_auto_send_btn.setEnabled(False)
             self.stop_auto_send_btn.setEnabled(True)
             logger.info("Auto-send process started")
-            # Show popup message every time auto-send is started
-            QMessageBox.information(self, "Info", "Auto-send sedang berjalan!")
+            # Show a status bar message every time auto-send is started
+            self.statusBar().showMessage("Auto-send sedang berjalan!", STATUS_MESSAGE_MS)
         except Exception as e:
             logger.error(f"Failed to start auto-send: {e}")
             QMessageBox.critical(self, "Error", f"Failed to start auto-send: {str(e)}")
@@ -523,46 +615,48 @@ class ModernApp(QMainWindow):
     def stop_auto_send(self):
         """Stop the auto-send process."""
         try:
+            # The worker is the only writer of its auto-send state
             self.worker_thread.send_command('stop_auto_send')
-            # Ensure complete cleanup of auto-send state
-            if hasattr(self.worker_thread, 'auto_sender'):
-                self.worker_thread.auto_sender = None
-            self.worker_thread.auto_send_running = False
+            self._auto_send_running = False
+            self._auto_send_pending += 1
             self.auto_send_status.setText("Auto Send: Tidak Aktif")
             self.start_auto_send_btn.setEnabled(True)
             self.stop_auto_send_btn.setEnabled(False)
             logger.info("Auto-send process stopped")
-            QMessageBox.information(self, "Info", "Auto-send berhasil dihentikan!")
         except Exception as e:
             logger.error(f"Error stopping auto-send: {e}")
             QMessageBox.critical(self, "Error", f"Error stopping auto-send: {str(e)}")
 
     def closeEvent(self, event):
-        """Handle window close event."""
+        """Handle window close event.
+
+        The first close only asks the worker to close the browser and exit;
+        the window closes for real once the worker thread has finished or after
+        CLOSE_TIMEOUT_MS, so the GUI thread never blocks on Playwright.
+        """
+        if self.worker_thread.isRunning() and not self._closing:
+            self._closing = True
+            self.disable_all_buttons()
+            self.status_label.setText("Closing browser...")
+            # 'close' also stops auto-send in the worker
+            self.worker_thread.send_command('close')
+            self.worker_thread.shutdown()
+            self._close_timer = QTimer(self)
+            self._close_timer.setSingleShot(True)
+            self._close_timer.timeout.connect(self.close)
+            self._close_timer.start(CLOSE_TIMEOUT_MS)
+            event.ignore()
+            return
+        if self._close_timer is not None:
+            self._close_timer.stop()
         try:
-            # Stop auto-send if running
-            if self.worker_thread and self.worker_thread.auto_send_running:
-                self.stop_auto_send()
-                # Wait a bit for auto-send to stop
-                time.sleep(1)
-            
-            # Stop the worker thread
-            if self.worker_thread:
-                self.worker_thread.running = False
-                self.worker_thread.send_command('close')
-                # Wait for worker thread to finish
-                self.worker_thread.wait(5000)  # Wait up to 5 seconds
-                self.worker_thread.quit()
+            if self.worker_thread.isFinished():
                 self.worker_thread.deleteLater()
-            
-            # Close browser and cleanup Playwright
-            if self.browser_manager:
-                try:
-                    self.browser_manager.stop_browser()
-                except Exception as e:
-                    logger.error(f"Error closing browser: {e}")
-                self.browser_manager = None
-                
+            else:
+                # Timed out. Deleting a running QThread aborts the process; leave it to exit
+                logger.warning("Worker thread is still running at exit; not deleting it")
+            # Write pending settings once, at exit
+            self.settings.sync()
             logger.info("Application closed successfully")
         except Exception as e:
             logger.error(f"Error during application closure: {e}")
@@ -587,6 +681,8 @@ class ModernApp(QMainWindow):
                 # Save the directory of the selected file for next time
                 self.settings.setValue('last_directory', str(Path(file_path).parent))
                 self.file_path = file_path
+                self._excel_cache.clear()
+                self._sheet_cache = None
                 self.file_label.setText(file_path)
                 logger.info(f"File dipilih: {file_path}")
         except Exception as e:
@@ -601,7 +697,7 @@ class ModernApp(QMainWindow):
         try:
             # Get the current tab index
             current_index = self.tab_widget.currentIndex()
-            page_type = 'auto_input' if current_index == 0 else 'metar'
+            page_type = _TAB_PAGE_TYPES[current_index]
             
             self.disable_all_buttons()
             self.status_label.setText("Opening browser...")
@@ -625,62 +721,114 @@ class ModernApp(QMainWindow):
 
     def run_processing(self):
         try:
-            FileHandler.validate_file_path(self.file_label.text())
+            file_path = self.file_label.text()
+            st = FileHandler.validate_file_path(file_path)
             selected_time = int(self.time_combo.currentText().split(":")[0])
-            updater = UserInputUpdater(default_user_input.copy())
-            user_input = updater.update_from_file(
-                self.file_label.text(),
-                selected_time,
-                "input_data"
-            )
-            self.worker_thread.send_command('fill', {'user_input': user_input})
+            key = (file_path, st.st_mtime, selected_time)
+            user_input = self._excel_cache.get(key)
+            if user_input is None:
+                # Parsing Excel dilakukan di thread pool agar UI dan worker browser tidak tertahan
+                sheet = None
+                if self._sheet_cache is not None and self._sheet_cache[0] == key[:2]:
+                    sheet = self._sheet_cache[1]
+                else:
+                    self.status_label.setText("Reading Excel file...")
+                task = ExcelLoadTask(file_path, selected_time, key, sheet)
+                task.signals.loaded.connect(self.excel_loaded, Qt.ConnectionType.QueuedConnection)
+                task.signals.failed.connect(self.handle_error, Qt.ConnectionType.QueuedConnection)
+                QThreadPool.globalInstance().start(task)
+            else:
+                logger.info(f"Memakai data Excel dari cache untuk jam {selected_time:02d}")
+                self.worker_thread.send_command('fill', {'user_input': user_input})
             self.disable_all_buttons()
         except Exception as e:
             logger.error(f"Failed to start process: {e}")
             QMessageBox.critical(self, "Error", f"Failed to start process: {str(e)}")
 
+    def excel_loaded(self, key, user_input, sheet):
+        """Cache the parsed Excel input and continue with filling the form."""
+        self._sheet_cache = (key[:2], sheet)
+        if len(self._excel_cache) >= EXCEL_CACHE_SIZE:
+            # Buang entri tertua (dict menyimpan urutan penyisipan)
+            del self._excel_cache[next(iter(self._excel_cache))]
+        self._excel_cache[key] = user_input
+        self.worker_thread.send_command('fill', {'user_input': user_input})
+
     def worker_finished(self, action):
         """Handle worker thread completion."""
+        if self._closing:
+            # Buttons stay disabled while the window waits for the worker to exit
+            return
+        if action == 'close':
+            self._auto_send_running = False
+            self._auto_send_pending = 0
+        elif action in ('start_auto_send', 'stop_auto_send'):
+            self._auto_send_pending = max(0, self._auto_send_pending - 1)
+            if not self._auto_send_pending:
+                self._auto_send_running = action == 'start_auto_send'
         if action == 'open':
             self.browser_opened = True
             # Sync the browser manager with METAR tab
-            if hasattr(self, 'metar_tab'):
-                self.metar_tab.browser_manager = self.worker_thread.browser_manager
+            self.metar_tab.browser_manager = self.worker_thread.browser_manager
             self.status_label.setText("Browser opened and ready!")
-            QMessageBox.information(self, "Sukses", "Browser dibuka dan siap digunakan!")
+            self.statusBar().showMessage("Browser dibuka dan siap digunakan!", STATUS_MESSAGE_MS)
         elif action == 'fill':
             self.status_label.setText("Form filled successfully!")
-            QMessageBox.information(self, "Sukses", "Form berhasil diisi!")
+            self.statusBar().showMessage("Form berhasil diisi!", STATUS_MESSAGE_MS)
+        elif action == 'process_metar':
+            self.metar_tab.metar_processed()
         elif action == 'reload':
             self.status_label.setText("Page refreshed successfully!")
-            QMessageBox.information(self, "Sukses", "Halaman berhasil dimuat ulang!")
+            self.statusBar().showMessage("Halaman berhasil dimuat ulang!", STATUS_MESSAGE_MS)
         elif action == 'start_auto_send':
             self.status_label.setText("Auto-send started!")
         elif action == 'stop_auto_send':
             self.status_label.setText("Auto-send stopped!")
-            QMessageBox.information(self, "Sukses", "Auto-send berhasil dihentikan!")
+            self.statusBar().showMessage("Auto-send berhasil dihentikan!", STATUS_MESSAGE_MS)
         elif action == 'close':
             self.browser_opened = False
-            if hasattr(self, 'metar_tab'):
-                self.metar_tab.browser_manager = None
+            self.metar_tab.browser_manager = None
             self.status_label.setText("Browser closed.")
-            QMessageBox.information(self, "Info", "Browser ditutup.")
+            self.statusBar().showMessage("Browser ditutup.", STATUS_MESSAGE_MS)
         self.update_button_states()
 
+    def _worker_stopped(self):
+        """Finish a pending window close once the worker thread has exited."""
+        if self._closing:
+            self.close()
+
     def handle_error(self, error_message):
         """Handle process errors."""
         logger.error(f"Proses gagal: {error_message}")
+        if self._closing:
+            # No modal while the window is shutting down
+            return
         QMessageBox.critical(self, "Error", f"Proses gagal: {error_message}")
+        self.metar_tab.reset_to_initial_state()
         self.update_button_states()
 
     def update_status(self, message: str):
-        """Update the status label with the given message."""
-        if hasattr(self, 'status_label'):
-            self.status_label.setText(message)
-            logger.info(message)
-        # Also update METAR tab status if it exists
-        if hasattr(self, 'metar_tab'):
-            self.metar_tab.update_status(message)
+        """Queue a status message; bursts are shown as their latest message.
+
+        Worker signals are queued, so this only runs after setup_ui() has
+        created both status labels.
+        """
+        self._pending_status = message
+        if "Error" in message or "Timeout" in message:
+            # The METAR tab resets on these, so they must not be coalesced away
+            self._status_timer.stop()
+            self._flush_status()
+        elif not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """Show the latest pending status message on both tabs."""
+        message, self._pending_status = self._pending_status, None
+        if message is None:
+            return
+        self.status_label.setText(message)
+        # Also update METAR tab status
+        self.metar_tab.update_status(message)
 
     def update_button_states(self):
         """Update the state of all buttons based on current conditions."""
@@ -695,7 +843,7 @@ class ModernApp(QMainWindow):
         # Enable time selection always
         self.time_combo.setEnabled(True)
         # Auto Sender controls
-        auto_sender_running = self.worker_thread.auto_send_running if hasattr(self.worker_thread, 'auto_send_running') else False
+        auto_sender_running = self._auto_send_running
         self.start_auto_send_btn.setEnabled(self.browser_opened and not auto_sender_running)
         self.stop_auto_send_btn.setEnabled(auto_sender_running)
 
@@ -706,18 +854,13 @@ class ModernApp(QMainWindow):
             index: Index of the selected tab
         """
         try:
-            if not self.browser_manager or not self.browser_manager.page:
+            if not self.browser_opened:
                 return
                 
-            # Map tab index to page type
-            page_types = {
-                0: 'auto_input',
-                1: 'metar'
-            }
-            
-            page_type = page_types.get(index)
-            if page_type:
-                self.browser_manager.navigate_to_page(page_type)
+            if 0 <= index < len(_TAB_PAGE_TYPES):
+                page_type = _TAB_PAGE_TYPES[index]
+                # Navigation runs in the worker, which owns the browser page
+                self.worker_thread.send_command('navigate', {'page_type': page_type})
                 
         except Exception as e:
             logger.error(f"Error handling tab change: {e}")
@@ -725,6 +868,7 @@ class ModernApp(QMainWindow):
 
 def main():
     """Run the application."""
+    ensure_logging()
     try:
         app = QApplication(sys.argv)
         window = ModernApp()
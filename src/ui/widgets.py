@@ -0,0 +1,26 @@
+"""
+Small widget helpers shared by the UI tabs.
+"""
+from PyQt6.QtWidgets import QGroupBox, QHBoxLayout, QLayout, QVBoxLayout
+
+
+def group_box(title, items, horizontal=False):
+    """Build a QGroupBox holding the given widgets and layouts.
+
+    Args:
+        title: Group box title
+        items: Widgets or layouts, added in order
+        horizontal: Use a QHBoxLayout instead of a QVBoxLayout
+
+    Returns:
+        QGroupBox: The configured group box
+    """
+    group = QGroupBox(title)
+    layout = QHBoxLayout() if horizontal else QVBoxLayout()
+    for item in items:
+        if isinstance(item, QLayout):
+            layout.addLayout(item)
+        else:
+            layout.addWidget(item)
+    group.setLayout(layout)
+    return group
@@ -2,7 +2,7 @@
 Utility functions and classes for BMKG Auto Input.
 """
 
-from .logger import get_logger, setup_logging
+from .logger import get_logger, setup_logging, ensure_logging
 from .config import Config, init_config
 
-__all__ = ['get_logger', 'setup_logging', 'Config', 'init_config'] 
\ No newline at end of file
+__all__ = ['get_logger', 'setup_logging', 'ensure_logging', 'Config', 'init_config'] 
\ No newline at end of file
@@ -1,19 +1,79 @@
 """
 Configuration management for the BMKG Auto Input application.
 """
+import copy
+import csv
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
-import yaml
-from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=None)
+def _yaml_backend():
+    """Import PyYAML on first use; returns (yaml, SafeLoader, SafeDumper).
+
+    The libyaml C implementation is used when PyYAML was built with it.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+    return yaml, SafeLoader, SafeDumper
+
+# Sentinel for a key that is not present in the config
+_MISSING = object()
+
+# Dot-notation keys split into their path components, shared by all instances
+_PATH_CACHE: Dict[str, tuple] = {}
+
+
+def _split_key(key: str) -> tuple:
+    """Return the components of a dot-notation key, splitting each key only once.
+
+    A dot escaped as ``\\.`` is kept as part of the component name.
+    """
+    path = _PATH_CACHE.get(key)
+    if path is None:
+        if '\\.' in key:
+            parts = next(csv.reader([key], delimiter='.', escapechar='\\',
+                                    quoting=csv.QUOTE_NONE))
+        else:
+            parts = key.split('.')
+        path = _PATH_CACHE.setdefault(key, tuple(parts))
+    return path
+
+
+# Parsed YAML per (absolute path, mtime_ns, size); reused while the file is unchanged
+_PARSE_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _forget_parsed(path: str) -> None:
+    """Drop cached parses of the given config file."""
+    for key in [key for key in _PARSE_CACHE if key[0] == path]:
+        del _PARSE_CACHE[key]
+
 
 class Config:
     """Configuration management class."""
+
+    # Environment variables that override config values: (variable, key path)
+    _ENV_MAPPINGS = (
+        ('BMKG_USER_DATA_DIR', ('paths', 'user_data_dir')),
+        ('BMKG_LOG_LEVEL', ('logging', 'level')),
+        ('BMKG_BROWSER_TYPE', ('browser', 'type')),
+        ('BMKG_BROWSER_HEADLESS', ('browser', 'headless')),
+        ('BMKG_TIMEOUT', ('browser', 'timeout')),
+    )
     
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self._get_default_config_path()
         self.config_data: Dict[str, Any] = {}
         self._load_config()
+        # save() is skipped while nothing was set and config_data was not replaced
+        self._dirty = False
+        self._saved_data = self.config_data
     
     def _get_default_config_path(self) -> str:
         """Get the default configuration file path."""
@@ -21,30 +81,40 @@ class Config:
     
     def _load_config(self) -> None:
         """Load configuration from file and environment variables."""
+        from dotenv import load_dotenv
+
         # Load environment variables
         load_dotenv()
         
-        # Load YAML config if exists
-        if os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                self.config_data = yaml.safe_load(f) or {}
+        # Load YAML config if exists; opening it directly avoids a separate existence check
+        try:
+            f = open(self.config_path, 'rb')
+        except FileNotFoundError:
+            f = None
+        if f is not None:
+            with f:
+                st = os.fstat(f.fileno())
+                path = os.path.abspath(self.config_path)
+                key = (path, st.st_mtime_ns, st.st_size)
+                parsed = _PARSE_CACHE.get(key)
+                if parsed is None:
+                    # Bytes are decoded by the loader itself
+                    yaml, SafeLoader, _ = _yaml_backend()
+                    parsed = yaml.load(f, Loader=SafeLoader) or {}
+                    _forget_parsed(path)
+                    _PARSE_CACHE[key] = parsed
+            # Each instance gets its own copy so set() does not leak into the cache
+            self.config_data = copy.deepcopy(parsed)
         
         # Override with environment variables
         self._override_from_env()
     
     def _override_from_env(self) -> None:
         """Override configuration with environment variables."""
-        env_mappings = {
-            'BMKG_USER_DATA_DIR': ('paths', 'user_data_dir'),
-            'BMKG_LOG_LEVEL': ('logging', 'level'),
-            'BMKG_BROWSER_TYPE': ('browser', 'type'),
-            'BMKG_BROWSER_HEADLESS': ('browser', 'headless'),
-            'BMKG_TIMEOUT': ('browser', 'timeout'),
-        }
-        
-        for env_var, config_path in env_mappings.items():
-            if env_var in os.environ:
-                self._set_nested_value(self.config_data, config_path, os.environ[env_var])
+        for env_var, config_path in self._ENV_MAPPINGS:
+            value = os.environ.get(env_var)
+            if value is not None:
+                self._set_nested_value(self.config_data, config_path, value)
     
     def _set_nested_value(self, d: Dict[str, Any], path: tuple, value: Any) -> None:
         """Set a value in a nested dictionary using a tuple path."""
@@ -64,8 +134,10 @@ class Config:
             The configuration value
         """
         try:
+            if '.' not in key:
+                return self.config_data[key]
             value = self.config_data
-            for k in key.split('.'):
+            for k in _split_key(key):
                 value = value[k]
             return value
         except (KeyError, TypeError):
@@ -79,14 +151,26 @@ class Config:
             key: The configuration key (dot notation supported)
             value: The value to set
         """
-        keys = key.split('.')
-        self._set_nested_value(self.config_data, tuple(keys), value)
+        if self.get(key, _MISSING) != value:
+            self._dirty = True
+        self._set_nested_value(self.config_data, _split_key(key), value)
     
     def save(self) -> None:
-        """Save the current configuration to file."""
+        """Save the current configuration to file if it has changed."""
+        if (not self._dirty and self.config_data is self._saved_data
+                and os.path.exists(self.config_path)):
+            return
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-        with open(self.config_path, 'w') as f:
-            yaml.dump(self.config_data, f, default_flow_style=False)
+        yaml, _, SafeDumper = _yaml_backend()
+        data = yaml.dump(self.config_data, Dumper=SafeDumper, default_flow_style=False)
+        # Write next to the target and rename, so a crash never leaves a half-written file
+        tmp_path = self.config_path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, self.config_path)
+        self._dirty = False
+        self._saved_data = self.config_data
+        _forget_parsed(os.path.abspath(self.config_path))
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -123,5 +207,14 @@ def init_config() -> Config:
         config.save()
     return config
 
-# Initialize configuration
-config = init_config() 
\ No newline at end of file
+# The shared configuration is created on first access of `config`
+_config: Optional[Config] = None
+
+
+def __getattr__(name: str) -> Any:
+    global _config
+    if name == 'config':
+        if _config is None:
+            _config = init_config()
+        return _config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
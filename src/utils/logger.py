@@ -1,15 +1,50 @@
 """
 Logging configuration for the BMKG Auto Input application.
 """
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
+from functools import lru_cache
+
+# Formatters are stateless; one instance of each is shared by all handlers
+DETAILED_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+ERROR_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s\n'
+    'File: %(pathname)s\n'
+    'Line: %(lineno)d\n'
+    'Function: %(funcName)s\n'
+)
+
+# Rotation size of each log file. Large enough that rollover is rare; the
+# application runs on Windows desktops, so there is no logrotate to hand
+# rotation to and the handlers keep rotating themselves
+LOG_MAX_BYTES = 100*1024*1024  # 100MB
+LOG_BACKUP_COUNT = 5
+
+# Level names accepted by setup_logger
+_LEVELS = {name: getattr(logging, name) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}
+
+# No format string uses thread or process fields; skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
 class LogConfig:
-    """Configuration for application logging."""
+    """Configuration for application logging.
+
+    Loggers only enqueue records through a QueueHandler on the root logger;
+    a QueueListener thread formats them and writes the console and log files.
+    """
+
+    # Listener of the most recent configuration, stopped when logging is reconfigured
+    _active: Optional['LogConfig'] = None
     
     def __init__(self, log_dir=None):
         # Set default log directory if none provided
@@ -22,6 +57,10 @@ class LogConfig:
         self.app_log = self.log_dir / "app.log"
         self.browser_log = self.log_dir / "browser.log"
         self.error_log = self.log_dir / "error.log"
+
+        # Handlers run by the listener thread, filled in by _configure_*
+        self._handlers = []
+        self.listener = None
         
         # Configure loggers
         self._configure_loggers()
@@ -35,14 +74,51 @@ class LogConfig:
         self._configure_app_logger()
         self._configure_browser_logger()
         self._configure_error_logger()
+
+        # Start writing queued records in the background
+        self.start()
         
         # Log initial configuration
         root_logger = logging.getLogger()
-        root_logger.debug("Logging configuration initialized")
-        root_logger.debug(f"Log directory: {self.log_dir}")
-        root_logger.debug(f"App log: {self.app_log}")
-        root_logger.debug(f"Browser log: {self.browser_log}")
-        root_logger.debug(f"Error log: {self.error_log}")
+        if root_logger.isEnabledFor(logging.DEBUG):
+            root_logger.debug("Logging configuration initialized")
+            root_logger.debug("Log directory: %s", self.log_dir)
+            root_logger.debug("App log: %s", self.app_log)
+            root_logger.debug("Browser log: %s", self.browser_log)
+            root_logger.debug("Error log: %s", self.error_log)
+
+    def start(self) -> None:
+        """Start the listener thread, stopping the one of any other configuration."""
+        if LogConfig._active is not None and LogConfig._active is not self:
+            LogConfig._active.stop()
+        if self.listener is None:
+            self.listener = logging.handlers.QueueListener(
+                self._queue, *self._handlers, respect_handler_level=True
+            )
+            self.listener.start()
+        LogConfig._active = self
+
+    def stop(self) -> None:
+        """Write out all queued records and stop the listener thread."""
+        if self.listener is not None:
+            # stop() drains the queue; each handler flushes after every record
+            self.listener.stop()
+            self.listener = None
+        if LogConfig._active is self:
+            LogConfig._active = None
+    
+    def _file_handler(self, path: Path, level: int,
+                      formatter: logging.Formatter) -> logging.Handler:
+        """Create the single rotating handler of a log file and register it with the listener."""
+        handler = logging.handlers.RotatingFileHandler(
+            path,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT
+        )
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+        self._handlers.append(handler)
+        return handler
     
     def _configure_root_logger(self) -> None:
         """Configure the root logger."""
@@ -52,47 +128,27 @@ class LogConfig:
         # Remove any existing handlers
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
+
+        # The only handler on the logging path: it enqueues records for the listener
+        self._queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(self._queue))
         
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        console_handler.setFormatter(DETAILED_FORMATTER)
+        self._handlers.append(console_handler)
         
-        # Root file handler
-        file_handler = logging.handlers.RotatingFileHandler(
-            self.app_log,
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
-        )
-        file_handler.setLevel(logging.DEBUG)  # Capture all messages
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        # Root file handler, capturing all messages
+        self._app_handler = self._file_handler(self.app_log, logging.DEBUG, DETAILED_FORMATTER)
     
     def _configure_app_logger(self) -> None:
         """Configure the application logger."""
         app_logger = logging.getLogger('app')
         app_logger.setLevel(logging.DEBUG)  # Set to DEBUG to capture all messages
+        # app.log is written by the root file handler; a second handler here
+        # would write every record twice
         app_logger.propagate = True  # Propagate to root logger
-        
-        # File handler
-        file_handler = logging.handlers.RotatingFileHandler(
-            self.app_log,
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
-        )
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(file_formatter)
-        app_logger.addHandler(file_handler)
     
     def _configure_browser_logger(self) -> None:
         """Configure the browser automation logger."""
@@ -100,18 +156,9 @@ class LogConfig:
         browser_logger.setLevel(logging.DEBUG)  # Set to DEBUG to capture all messages
         browser_logger.propagate = True  # Propagate to root logger
         
-        # File handler
-        file_handler = logging.handlers.RotatingFileHandler(
-            self.browser_log,
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
-        )
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(file_formatter)
-        browser_logger.addHandler(file_handler)
+        # File handler, fed from the root queue and limited to browser records
+        self._browser_handler = self._file_handler(self.browser_log, logging.DEBUG, DETAILED_FORMATTER)
+        self._browser_handler.addFilter(logging.Filter('browser'))
     
     def _configure_error_logger(self) -> None:
         """Configure the error logger."""
@@ -119,26 +166,17 @@ class LogConfig:
         error_logger.setLevel(logging.ERROR)
         error_logger.propagate = True  # Propagate to root logger
         
-        # File handler
-        file_handler = logging.handlers.RotatingFileHandler(
-            self.error_log,
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5
-        )
-        file_handler.setLevel(logging.ERROR)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s\n'
-            'File: %(pathname)s\n'
-            'Line: %(lineno)d\n'
-            'Function: %(funcName)s\n'
-            'Exception: %(exc_info)s\n'
-        )
-        file_handler.setFormatter(file_formatter)
-        error_logger.addHandler(file_handler)
+        # File handler, fed from the root queue and limited to error-logger records
+        self._error_handler = self._file_handler(self.error_log, logging.ERROR, ERROR_FORMATTER)
+        self._error_handler.addFilter(logging.Filter('error'))
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get or create a logger instance.
+
+    logging.getLogger() already returns one logger per name; the cache only
+    skips its module lock on repeat calls.
     
     Args:
         name: Name of the logger
@@ -160,8 +198,34 @@ def setup_logging(log_dir: Optional[str] = None) -> LogConfig:
     """
     return LogConfig(log_dir)
 
-# Initialize logging when module is imported
-log_config = setup_logging() 
+# Configured on first use instead of at import, so importing this module
+# opens no log files; the application entry point calls ensure_logging()
+_log_config: Optional[LogConfig] = None
+
+def ensure_logging() -> LogConfig:
+    """
+    Set up the default logging configuration once and return it.
+    
+    Returns:
+        LogConfig instance.
+    """
+    global _log_config
+    if _log_config is None:
+        _log_config = setup_logging()
+    return _log_config
+
+def __getattr__(name):
+    if name == 'log_config':
+        return ensure_logging()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@atexit.register
+def _stop_logging() -> None:
+    """Write out records still queued when the interpreter exits."""
+    if LogConfig._active is not None:
+        LogConfig._active.stop()
+
 
 def setup_logger(name: str, log_level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """
@@ -178,17 +242,12 @@ def setup_logger(name: str, log_level: str = "INFO", log_file: Optional[str] = N
     logger = logging.getLogger(name)
     
     # Set log level
-    level = getattr(logging, log_level.upper(), logging.INFO)
+    level = _LEVELS.get(log_level) or _LEVELS.get(log_level.upper(), logging.INFO)
     logger.setLevel(level)
     
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
     # Add console handler
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(detailed_formatter)
+    console_handler.setFormatter(DETAILED_FORMATTER)
     logger.addHandler(console_handler)
     
     # Add file handler if log_file is specified
@@ -202,7 +261,7 @@ def setup_logger(name: str, log_level: str = "INFO", log_file: Optional[str] = N
         file_handler = logging.FileHandler(
             log_dir / f"{log_file}_{timestamp}.log"
         )
-        file_handler.setFormatter(detailed_formatter)
+        file_handler.setFormatter(DETAILED_FORMATTER)
         logger.addHandler(file_handler)
     
     return logger 
\ No newline at end of file
@@ -1,5 +1,6 @@
 import time
 import logging
+from collections import Counter
 from functools import wraps
 from typing import TypeVar, Callable, Any, Optional, Type, Union, Tuple
 from ..exceptions import AutoSenderError
@@ -32,59 +33,58 @@ def with_retry(
         backoff_factor: Factor to increase delay between retries
         exceptions: Exception(s) to catch and retry on
     """
+    # Backoff delay before retry n+1; the parameters are fixed per decoration
+    delays = tuple(
+        min(initial_delay * (backoff_factor ** i), max_delay)
+        for i in range(max_retries)
+    )
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            retry_context = RetryContext(max_retries, initial_delay, max_delay, backoff_factor)
-            
-            while retry_context.current_retry <= max_retries:
+            # First attempt: no retry state is set up when it succeeds
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                last_error = e
+
+            for attempt, delay in enumerate(delays, 1):
+                logging.warning(
+                    "Attempt %d/%d failed. Retrying in %.2f seconds. Error: %s",
+                    attempt, max_retries, delay, last_error
+                )
+                time.sleep(delay)
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    retry_context.last_error = e
-                    retry_context.current_retry += 1
-                    
-                    if retry_context.current_retry > max_retries:
-                        raise AutoSenderError(
-                            f"Failed after {max_retries} retries. Last error: {str(e)}",
-                            original_error=e
-                        )
-                    
-                    delay = min(
-                        initial_delay * (backoff_factor ** (retry_context.current_retry - 1)),
-                        max_delay
-                    )
-                    
-                    logging.warning(
-                        f"Attempt {retry_context.current_retry}/{max_retries} failed. "
-                        f"Retrying in {delay:.2f} seconds. Error: {str(e)}"
-                    )
-                    time.sleep(delay)
-            
-            raise AutoSenderError("Unexpected retry loop exit", original_error=retry_context.last_error)
+                    last_error = e
+
+            raise AutoSenderError(
+                f"Failed after {max_retries} retries. Last error: {str(last_error)}",
+                original_error=last_error
+            ) from last_error
         
         return wrapper
     return decorator
 
 class ErrorTracker:
     def __init__(self):
-        self.error_counts: dict[str, int] = {}
+        self.error_counts: Counter[str] = Counter()
         self.total_errors = 0
     
     def log_error(self, error_type: str, error: Exception) -> None:
         """Track and log an error occurrence."""
-        self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+        self.error_counts[error_type] += 1
         self.total_errors += 1
         
         logging.error(
-            f"Error occurred: {error_type} - {str(error)}. "
-            f"Total errors: {self.total_errors}, "
-            f"Type count: {self.error_counts[error_type]}"
+            "Error occurred: %s - %s. Total errors: %d, Type count: %d",
+            error_type, error, self.total_errors, self.error_counts[error_type]
         )
     
     def get_error_summary(self) -> dict[str, Any]:
         """Get a summary of all tracked errors."""
         return {
             "total_errors": self.total_errors,
-            "error_counts": self.error_counts
+            "error_counts": dict(self.error_counts)
         } 
\ No newline at end of file
@@ -3,7 +3,7 @@ Tests for the autoinput functionality.
 """
 import pytest
 from unittest.mock import Mock, patch
-from src.core.autoinput import AutoInput
+from src.core.autoinput import AutoInput, ANIMATIONS_STYLE_ID, DISABLE_ANIMATIONS_CSS
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -87,6 +87,29 @@ def test_autoinput_fill_form(mock_fill_form, mock_page, sample_user_input, mock_
     autoinput.fill_form()
     mock_fill_form.assert_called_once()
 
+def test_autoinput_disables_animations_before_filling(mock_page, sample_user_input, mock_weather_codes):
+    """Test that the animation CSS is injected under a fixed id, before any field is touched."""
+    # Stop right after the injection step
+    mock_page.locator.side_effect = Exception("stop")
+
+    autoinput = AutoInput(
+        mock_page,
+        sample_user_input,
+        mock_weather_codes['obs'],
+        mock_weather_codes['ww'],
+        mock_weather_codes['w1w2'],
+        mock_weather_codes['awan_lapisan'],
+        mock_weather_codes['arah_angin'],
+        mock_weather_codes['ci'],
+        mock_weather_codes['cm'],
+        mock_weather_codes['ch']
+    )
+    autoinput.fill_form()
+
+    mock_page.evaluate.assert_called_once()
+    assert mock_page.evaluate.call_args.args[1] == [ANIMATIONS_STYLE_ID, DISABLE_ANIMATIONS_CSS]
+    mock_page.add_style_tag.assert_not_called()
+
 def test_autoinput_error_handling(mock_page, sample_user_input, mock_weather_codes):
     """Test error handling in AutoInput."""
     mock_page.locator.side_effect = Exception("Test error")
@@ -0,0 +1,80 @@
+"""
+Tests for src.utils.config.Config.
+"""
+import os
+
+import pytest
+
+from src.utils.config import Config
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """A config.yaml with nested and dotted keys, without environment overrides."""
+    for env_var, _ in Config._ENV_MAPPINGS:
+        monkeypatch.delenv(env_var, raising=False)
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "a:\n"
+        "  b: 1\n"
+        "browser:\n"
+        "  timeout: 30000\n"
+        "hosts:\n"
+        "  example.com: 8080\n"
+    )
+    return path
+
+
+def test_get_nested_and_default(config_file):
+    c = Config(str(config_file))
+    assert c.get('a.b') == 1
+    assert c.get('browser.timeout') == 30000
+    assert c.get('a.missing') is None
+    assert c.get('a.missing', 'x') == 'x'
+    assert c.get('a.b.c', 'x') == 'x'
+
+
+def test_set_then_get(config_file):
+    c = Config(str(config_file))
+    c.set('a.b', 2)
+    c.set('new.key', 'v')
+    assert c.get('a.b') == 2
+    assert c.get('new') == {'key': 'v'}
+
+
+def test_get_sees_changes_made_through_returned_dict(config_file):
+    c = Config(str(config_file))
+    assert c.get('a.b') == 1
+    c.get('a')['b'] = 5
+    assert c.get('a.b') == 5
+
+
+def test_get_after_config_data_replaced(config_file):
+    c = Config(str(config_file))
+    assert c.get('a.b') == 1
+    c.config_data = {'a': {'b': 3}}
+    assert c.get('a.b') == 3
+
+
+def test_escaped_dot_key(config_file):
+    c = Config(str(config_file))
+    assert c.get('hosts.example\\.com') == 8080
+    assert c.get('hosts.example') is None
+    c.set('hosts.other\\.org', 443)
+    assert c.get('hosts') == {'example.com': 8080, 'other.org': 443}
+
+
+def test_save_skipped_when_unchanged(config_file):
+    c = Config(str(config_file))
+    before = config_file.read_text()
+    c.set('a.b', 1)
+    c.save()
+    assert config_file.read_text() == before
+
+
+def test_save_writes_changes(config_file):
+    c = Config(str(config_file))
+    c.set('a.b', 2)
+    c.save()
+    assert not os.path.exists(str(config_file) + ".tmp")
+    assert Config(str(config_file)).get('a.b') == 2
@@ -0,0 +1,108 @@
+"""
+Tests for the form-filling helpers of src.data.input.AutoInput.
+
+The _settle and click_option tests also run against src.core.autoinput.AutoInput, the class the app uses.
+"""
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.core import autoinput as core_autoinput
+from src.data.input import AutoInput, _cloud_option
+
+
+class FakePage:
+    """Minimal page that dispatches request events registered with on()."""
+
+    def __init__(self):
+        self.listeners = {}
+        self.timers = []
+
+    def on(self, event, callback):
+        self.listeners.setdefault(event, []).append(callback)
+
+    def remove_listener(self, event, callback):
+        self.listeners[event].remove(callback)
+
+    def emit(self, event, request):
+        for callback in list(self.listeners.get(event, [])):
+            callback(request)
+
+    def wait_for_timeout(self, ms):
+        time.sleep(ms / 1000)
+        due = [t for t in self.timers if time.monotonic() >= t[0]]
+        for t in due:
+            self.timers.remove(t)
+            t[1]()
+
+
+def _auto_input(page, cls=AutoInput):
+    return cls(page, {}, {}, {}, {}, {}, {}, {}, {}, {})
+
+
+both_classes = pytest.mark.parametrize(
+    "cls", [AutoInput, core_autoinput.AutoInput], ids=["data", "core"])
+
+
+@both_classes
+def test_settle_waits_for_request_started_by_action(cls):
+    page = FakePage()
+    finished_at = []
+
+    def action():
+        # The action itself starts a request that completes 400 ms later
+        page.emit("request", "hour-change")
+        page.timers.append((time.monotonic() + 0.4,
+                            lambda: (finished_at.append(time.monotonic()),
+                                     page.emit("requestfinished", "hour-change"))))
+
+    start = time.monotonic()
+    _auto_input(page, cls)._settle(action, quiet_ms=100, max_ms=2000)
+    assert finished_at, "returned before the request triggered by the action finished"
+    assert time.monotonic() - start >= 0.4
+
+
+@both_classes
+def test_settle_removes_its_listeners(cls):
+    page = FakePage()
+    _auto_input(page, cls)._settle(lambda: None, quiet_ms=50, max_ms=500)
+    assert all(not callbacks for callbacks in page.listeners.values())
+
+
+def _clicked_pattern(name, cls):
+    """Pattern click_option passes to filter(has_text=...) for name."""
+    page = Mock()
+    _auto_input(page, cls).click_option(name)
+    return page.locator.return_value.filter.call_args.kwargs["has_text"]
+
+
+@both_classes
+def test_click_option_matches_whole_text(cls):
+    pattern = _clicked_pattern("1", cls)
+    assert pattern.search("1")
+    assert pattern.search(" 1 ")
+    assert not pattern.search("10")
+    assert not pattern.search("11 - altocumulus")
+
+
+@both_classes
+def test_click_option_is_strict(cls):
+    page = Mock()
+    _auto_input(page, cls).click_option("Dwi Harjanto")
+    # Clicked on the filtered locator itself, not on .first
+    page.locator.return_value.filter.return_value.click.assert_called_once_with()
+
+
+def test_cloud_option_matches_awan_lapisan_text():
+    pattern = _cloud_option("- cirrus (Ci)")
+    assert pattern.search("0 - cirrus (Ci)")
+    assert not pattern.search("1 - cirrocumulus (Cc)")
+    assert _cloud_option("/ - cloud not visible").search("/ - cloud not visible")
+
+
+def test_cloud_option_matches_default_code():
+    pattern = _cloud_option("8")
+    assert pattern.search("8 - cumulus (Cu)")
+    assert not pattern.search("0 - cirrus (Ci)")
+    assert not pattern.search("18 - other")
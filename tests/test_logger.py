@@ -0,0 +1,68 @@
+"""
+Tests for the logging configuration.
+"""
+import logging
+import logging.handlers
+
+import pytest
+
+from src.utils.logger import LogConfig
+
+
+@pytest.fixture
+def log_config(tmp_path):
+    """Configure logging into a temporary directory and restore it afterwards."""
+    names = ('', 'app', 'browser', 'error')
+    saved = {name: logging.getLogger(name).handlers[:] for name in names}
+    previous = LogConfig._active
+    config = LogConfig(tmp_path)
+    yield config
+    config.stop()
+    for handler in config._handlers:
+        handler.close()
+    if previous is not None:
+        previous.start()
+    for name in names:
+        logger = logging.getLogger(name)
+        for handler in logger.handlers[:]:
+            if handler not in saved[name]:
+                handler.close()
+        logger.handlers[:] = saved[name]
+
+
+def _lines_with(path, text):
+    return [line for line in path.read_text().splitlines() if text in line]
+
+
+def test_app_record_written_once_to_app_log(log_config):
+    logging.getLogger('app').info("app-record-marker")
+    log_config.stop()
+    assert len(_lines_with(log_config.app_log, "app-record-marker")) == 1
+
+
+def test_browser_record_written_once_per_file(log_config):
+    logging.getLogger('browser').info("browser-record-marker")
+    log_config.stop()
+    assert len(_lines_with(log_config.browser_log, "browser-record-marker")) == 1
+    assert len(_lines_with(log_config.app_log, "browser-record-marker")) == 1
+
+
+def test_records_are_written_by_listener_thread(log_config):
+    root_handlers = logging.getLogger().handlers
+    assert any(isinstance(h, logging.handlers.QueueHandler) for h in root_handlers)
+    assert not any(isinstance(h, logging.FileHandler) for h in root_handlers)
+    logging.getLogger('error').error("error-record-marker")
+    log_config.stop()
+    assert len(_lines_with(log_config.error_log, "error-record-marker")) == 1
+
+
+def test_error_log_keeps_traceback(log_config):
+    try:
+        raise ValueError("traceback-marker")
+    except ValueError:
+        logging.getLogger('error').exception("error-exception-marker")
+    log_config.stop()
+    text = log_config.error_log.read_text()
+    assert "Traceback (most recent call last)" in text
+    assert "ValueError: traceback-marker" in text
+    assert "Exception: None" not in text
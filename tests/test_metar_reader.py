@@ -1,369 +1,294 @@
+import importlib.util
+import types
+import unittest
+
 import pytest
-from src.core.metar_reader import MetarReader
-import json
+from src.core.metar_reader import MetarReader, parse_metar
+
+# All cases share one parsed corpus; with pytest-xdist keep them in one worker
+# via -n auto --dist=loadscope
+pytestmark = pytest.mark.cpu_heavy
+
+def _mk(tail, expected):
+    """Test case for a WADS METAR given without its "METAR WADS " prefix and "=" terminator."""
+    return {"metar": f"METAR WADS {tail}=", "expected": expected}
 
 # Test METAR codes with expected results
 TEST_CASES = [
-    {
-        "metar": "METAR WADS 230030Z 15005KT 9999 FEW020 28/25 Q1008 NOSIG=",
-        "expected": {
-            "station": "WADS",
-            "day": "23",
-            "hour": "00",
-            "minute": "30",
-            "wind_direction": "150",
-            "wind_speed": "05",
-            "visibility": "10000",
-            "clouds": [{"cloud_type": "FEW", "cloud_height": "020", "cloud_subtype": ""}],
-            "temperature": "28",
-            "dew_point": "25",
-            "pressure": "1008",
-            "trend_type": "NOSIG"
-        }
-    },
-    {
-        "metar": "METAR WADS 230000Z 15006KT 9999 FEW020 27/25 Q1008 NOSIG=",
-        "expected": {
-            "station": "WADS",
-            "day": "23",
-            "hour": "00",
-            "minute": "00",
-            "wind_direction": "150",
-            "wind_speed": "06",
-            "visibility": "10000",
-            "clouds": [{"cloud_type": "FEW", "cloud_height": "020", "cloud_subtype": ""}],
-            "temperature": "27",
-            "dew_point": "25",
-            "pressure": "1008",
-            "trend_type": "NOSIG"
-        }
-    },
-    {
-        "metar": "METAR WADS 130200Z 13003KT 9999 FEW018CB SCT020 30/25 Q1010 NOSIG RMK CB TO NW=",
-        "expected": {
-            "station": "WADS",
-            "day": "13",
-            "hour": "02",
-            "minute": "00",
-            "wind_direction": "130",
-            "wind_speed": "03",
-            "visibility": "10000",
-            "clouds": [
-                {"cloud_type": "FEW", "cloud_height": "018", "cloud_subtype": "CB"},
-                {"cloud_type": "SCT", "cloud_height": "020", "cloud_subtype": ""}
-            ],
-            "temperature": "30",
-            "dew_point": "25",
-            "pressure": "1010",
-            "trend_type": "NOSIG",
-            "remarks": "RMK CB TO NW"
-        }
-    },
-    {
-        "metar": "METAR WADS 130630Z 07004KT 9000 RA BKN018 31/26 Q1006 TEMPO TL0730 RA=",
-        "expected": {
-            "station": "WADS",
-            "day": "13",
-            "hour": "06",
-            "minute": "30",
-            "wind_direction": "070",
-            "wind_speed": "04",
-            "visibility": "9000",
-            "weather": ["RA"],
-            "clouds": [{"cloud_type": "BKN", "cloud_height": "018", "cloud_subtype": ""}],
-            "temperature": "31",
-            "dew_point": "26",
-            "pressure": "1006",
-            "trend_type": "TEMPO",
-            "trend_details": "TL0730 RA"
-        }
-    },
-    {
-        "metar": "METAR WADS 131100Z 19003KT 150V220 7000 SCT018 28/28 Q1008 NOSIG=",
-        "expected": {
-            "station": "WADS",
-            "day": "13",
-            "hour": "11",
-            "minute": "00",
-            "wind_direction": "190",
-            "wind_speed": "03",
-            "wind_variable_from": "150",
-            "wind_variable_to": "220",
-            "visibility": "7000",
-            "clouds": [{"cloud_type": "SCT", "cloud_height": "018", "cloud_subtype": ""}],
-            "temperature": "28",
-            "dew_point": "28",
-            "pressure": "1008",
-            "trend_type": "NOSIG"
-        }
-    },
-    {
-        "metar": "METAR WADS 131130Z 12006KT 080V140 5000 RA BKN018 28/27 Q1008 TEMPO TL1230 RA=",
-        "expected": {
-            "station": "WADS",
-            "day": "13",
-            "hour": "11",
-            "minute": "30",
-            "wind_direction": "120",
-            "wind_speed": "06",
-            "wind_variable_from": "080",
-            "wind_variable_to": "140",
-            "visibility": "5000",
-            "weather": ["RA"],
-            "clouds": [{"cloud_type": "BKN", "cloud_height": "018", "cloud_subtype": ""}],
-            "temperature": "28",
-            "dew_point": "27",
-            "pressure": "1008",
-            "trend_type": "TEMPO",
-            "trend_details": "TL1230 RA"
-        }
-    },
-    {
-        "metar": "METAR WADS 132030Z 13003KT 8000 FEW020CB 25/25 Q1009 NOSIG RMK CB TO N=",
-        "expected": {
-            "station": "WADS",
-            "day": "13",
-            "hour": "20",
-            "minute": "30",
-            "wind_direction": "130",
-            "wind_speed": "03",
-            "visibility": "8000",
-            "clouds": [{"cloud_type": "FEW", "cloud_height": "020", "cloud_subtype": "CB"}],
-            "temperature": "25",
-            "dew_point": "25",
-            "pressure": "1009",
-            "trend_type": "NOSIG",
-            "remarks": "RMK CB TO N"
-        }
-    },
-    {
-        "metar": "METAR WADS 150630Z 33008KT 8000 FEW017TCU SCT018 32/26 Q1007 NOSIG RMK TCU TO S=",
-        "expected": {
-            "station": "WADS",
-            "day": "15",
-            "hour": "06",
-            "minute": "30",
-            "wind_direction": "330",
-            "wind_speed": "08",
-            "visibility": "8000",
-            "clouds": [
-                {"cloud_type": "FEW", "cloud_height": "017", "cloud_subtype": "TCU"},
-                {"cloud_type": "SCT", "cloud_height": "018", "cloud_subtype": ""}
-            ],
-            "temperature": "32",
-            "dew_point": "26",
-            "pressure": "1007",
-            "trend_type": "NOSIG",
-            "remarks": "RMK TCU TO S"
-        }
-    },
-    {
-        "metar": "METAR WADS 150730Z 34005KT 310V020 9000 SCT020 31/26 Q1007 NOSIG=",
-        "expected": {
-            "station": "WADS",
-            "day": "15",
-            "hour": "07",
-            "minute": "30",
-            "wind_direction": "340",
-            "wind_speed": "05",
-            "wind_variable_from": "310",
-            "wind_variable_to": "020",
-            "visibility": "9000",
-            "clouds": [{"cloud_type": "SCT", "cloud_height": "020", "cloud_subtype": ""}],
-            "temperature": "31",
-            "dew_point": "26",
-            "pressure": "1007",
-            "trend_type": "NOSIG"
-        }
-    },
-    {
-        "metar": "METAR WADS 151700Z VRB02KT 5000 RA FEW015CB BKN017 26/26 Q1010 NOSIG RMK CB OTF=",
-        "expected": {
-            "station": "WADS",
-            "day": "15",
-            "hour": "17",
-            "minute": "00",
-            "wind_direction": "VRB",
-            "wind_speed": "02",
-            "visibility": "5000",
-            "weather": ["RA"],
-            "clouds": [
-                {"cloud_type": "FEW", "cloud_height": "015", "cloud_subtype": "CB"},
-                {"cloud_type": "BKN", "cloud_height": "017", "cloud_subtype": ""}
-            ],
-            "temperature": "26",
-            "dew_point": "26",
-            "pressure": "1010",
-            "trend_type": "NOSIG",
-            "remarks": "RMK CB OTF"
-        }
-    },
-    {
-        "metar": "METAR WADS 170000Z 13002KT CAVOK 27/25 Q1010 NOSIG=",
-        "expected": {
-            "station": "WADS",
-            "day": "17",
-            "hour": "00",
-            "minute": "00",
-            "wind_direction": "130",
-            "wind_speed": "02",
-            "visibility": "10000",
-            "cavok": True,
-            "clouds": [],
-            "temperature": "27",
-            "dew_point": "25",
-            "pressure": "1010",
-            "trend_type": "NOSIG"
-        }
-    },
-    {
-        "metar": "METAR WADS 010100Z VRB01KT 9999 FEW020 30/26 Q1010 NOSIG=",
-        "expected": {
-            "station": "WADS",
-            "day": "01",
-            "hour": "01",
-            "minute": "00",
-            "wind_direction": "VRB",
-            "wind_speed": "01",
-            "visibility": "10000",
-            "clouds": [{"cloud_type": "FEW", "cloud_height": "020", "cloud_subtype": ""}],
-            "temperature": "30",
-            "dew_point": "26",
-            "pressure": "1010",
-            "trend_type": "NOSIG"
-        }
-    },
-    {
-        "metar": "METAR WADS 010130Z VRB02KT 9999 FEW020 31/26 Q1010 NOSIG=",
-        "expected": {
-            "station": "WADS",
-            "day": "01",
-            "hour": "01",
-            "minute": "30",
-            "wind_direction": "VRB",
-            "wind_speed": "02",
-            "visibility": "10000",
-            "clouds": [{"cloud_type": "FEW", "cloud_height": "020", "cloud_subtype": ""}],
-            "temperature": "31",
-            "dew_point": "26",
-            "pressure": "1010",
-            "trend_type": "NOSIG"
-        }
-    }
+    _mk("230030Z 15005KT 9999 FEW020 28/25 Q1008 NOSIG", {
+        "station": "WADS",
+        "day": "23",
+        "hour": "00",
+        "minute": "30",
+        "wind_direction": "150",
+        "wind_speed": "05",
+        "visibility": "10000",
+        "clouds": [{"cloud_type": "FEW", "cloud_height": "020", "cloud_subtype": ""}],
+        "temperature": "28",
+        "dew_point": "25",
+        "pressure": "1008",
+        "trend_type": "NOSIG"
+    }),
+    _mk("230000Z 15006KT 9999 FEW020 27/25 Q1008 NOSIG", {
+        "station": "WADS",
+        "day": "23",
+        "hour": "00",
+        "minute": "00",
+        "wind_direction": "150",
+        "wind_speed": "06",
+        "visibility": "10000",
+        "clouds": [{"cloud_type": "FEW", "cloud_height": "020", "cloud_subtype": ""}],
+        "temperature": "27",
+        "dew_point": "25",
+        "pressure": "1008",
+        "trend_type": "NOSIG"
+    }),
+    _mk("130200Z 13003KT 9999 FEW018CB SCT020 30/25 Q1010 NOSIG RMK CB TO NW", {
+        "station": "WADS",
+        "day": "13",
+        "hour": "02",
+        "minute": "00",
+        "wind_direction": "130",
+        "wind_speed": "03",
+        "visibility": "10000",
+        "clouds": [
+            {"cloud_type": "FEW", "cloud_height": "018", "cloud_subtype": "CB"},
+            {"cloud_type": "SCT", "cloud_height": "020", "cloud_subtype": ""}
+        ],
+        "temperature": "30",
+        "dew_point": "25",
+        "pressure": "1010",
+        "trend_type": "NOSIG",
+        "remarks": "RMK CB TO NW"
+    }),
+    _mk("130630Z 07004KT 9000 RA BKN018 31/26 Q1006 TEMPO TL0730 RA", {
+        "station": "WADS",
+        "day": "13",
+        "hour": "06",
+        "minute": "30",
+        "wind_direction": "070",
+        "wind_speed": "04",
+        "visibility": "9000",
+        "weather": ["RA"],
+        "clouds": [{"cloud_type": "BKN", "cloud_height": "018", "cloud_subtype": ""}],
+        "temperature": "31",
+        "dew_point": "26",
+        "pressure": "1006",
+        "trend_type": "TEMPO",
+        "trend_details": "TL0730 RA"
+    }),
+    _mk("131100Z 19003KT 150V220 7000 SCT018 28/28 Q1008 NOSIG", {
+        "station": "WADS",
+        "day": "13",
+        "hour": "11",
+        "minute": "00",
+        "wind_direction": "190",
+        "wind_speed": "03",
+        "wind_variable_from": "150",
+        "wind_variable_to": "220",
+        "visibility": "7000",
+        "clouds": [{"cloud_type": "SCT", "cloud_height": "018", "cloud_subtype": ""}],
+        "temperature": "28",
+        "dew_point": "28",
+        "pressure": "1008",
+        "trend_type": "NOSIG"
+    }),
+    _mk("131130Z 12006KT 080V140 5000 RA BKN018 28/27 Q1008 TEMPO TL1230 RA", {
+        "station": "WADS",
+        "day": "13",
+        "hour": "11",
+        "minute": "30",
+        "wind_direction": "120",
+        "wind_speed": "06",
+        "wind_variable_from": "080",
+        "wind_variable_to": "140",
+        "visibility": "5000",
+        "weather": ["RA"],
+        "clouds": [{"cloud_type": "BKN", "cloud_height": "018", "cloud_subtype": ""}],
+        "temperature": "28",
+        "dew_point": "27",
+        "pressure": "1008",
+        "trend_type": "TEMPO",
+        "trend_details": "TL1230 RA"
+    }),
+    _mk("132030Z 13003KT 8000 FEW020CB 25/25 Q1009 NOSIG RMK CB TO N", {
+        "station": "WADS",
+        "day": "13",
+        "hour": "20",
+        "minute": "30",
+        "wind_direction": "130",
+        "wind_speed": "03",
+        "visibility": "8000",
+        "clouds": [{"cloud_type": "FEW", "cloud_height": "020", "cloud_subtype": "CB"}],
+        "temperature": "25",
+        "dew_point": "25",
+        "pressure": "1009",
+        "trend_type": "NOSIG",
+        "remarks": "RMK CB TO N"
+    }),
+    _mk("150630Z 33008KT 8000 FEW017TCU SCT018 32/26 Q1007 NOSIG RMK TCU TO S", {
+        "station": "WADS",
+        "day": "15",
+        "hour": "06",
+        "minute": "30",
+        "wind_direction": "330",
+        "wind_speed": "08",
+        "visibility": "8000",
+        "clouds": [
+            {"cloud_type": "FEW", "cloud_height": "017", "cloud_subtype": "TCU"},
+            {"cloud_type": "SCT", "cloud_height": "018", "cloud_subtype": ""}
+        ],
+        "temperature": "32",
+        "dew_point": "26",
+        "pressure": "1007",
+        "trend_type": "NOSIG",
+        "remarks": "RMK TCU TO S"
+    }),
+    _mk("150730Z 34005KT 310V020 9000 SCT020 31/26 Q1007 NOSIG", {
+        "station": "WADS",
+        "day": "15",
+        "hour": "07",
+        "minute": "30",
+        "wind_direction": "340",
+        "wind_speed": "05",
+        "wind_variable_from": "310",
+        "wind_variable_to": "020",
+        "visibility": "9000",
+        "clouds": [{"cloud_type": "SCT", "cloud_height": "020", "cloud_subtype": ""}],
+        "temperature": "31",
+        "dew_point": "26",
+        "pressure": "1007",
+        "trend_type": "NOSIG"
+    }),
+    _mk("151700Z VRB02KT 5000 RA FEW015CB BKN017 26/26 Q1010 NOSIG RMK CB OTF", {
+        "station": "WADS",
+        "day": "15",
+        "hour": "17",
+        "minute": "00",
+        "wind_direction": "VRB",
+        "wind_speed": "02",
+        "visibility": "5000",
+        "weather": ["RA"],
+        "clouds": [
+            {"cloud_type": "FEW", "cloud_height": "015", "cloud_subtype": "CB"},
+            {"cloud_type": "BKN", "cloud_height": "017", "cloud_subtype": ""}
+        ],
+        "temperature": "26",
+        "dew_point": "26",
+        "pressure": "1010",
+        "trend_type": "NOSIG",
+        "remarks": "RMK CB OTF"
+    }),
+    _mk("170000Z 13002KT CAVOK 27/25 Q1010 NOSIG", {
+        "station": "WADS",
+        "day": "17",
+        "hour": "00",
+        "minute": "00",
+        "wind_direction": "130",
+        "wind_speed": "02",
+        "visibility": "10000",
+        "cavok": True,
+        "clouds": [],
+        "temperature": "27",
+        "dew_point": "25",
+        "pressure": "1010",
+        "trend_type": "NOSIG"
+    }),
+    _mk("010100Z VRB01KT 9999 FEW020 30/26 Q1010 NOSIG", {
+        "station": "WADS",
+        "day": "01",
+        "hour": "01",
+        "minute": "00",
+        "wind_direction": "VRB",
+        "wind_speed": "01",
+        "visibility": "10000",
+        "clouds": [{"cloud_type": "FEW", "cloud_height": "020", "cloud_subtype": ""}],
+        "temperature": "30",
+        "dew_point": "26",
+        "pressure": "1010",
+        "trend_type": "NOSIG"
+    }),
+    _mk("010130Z VRB02KT 9999 FEW020 31/26 Q1010 NOSIG", {
+        "station": "WADS",
+        "day": "01",
+        "hour": "01",
+        "minute": "30",
+        "wind_direction": "VRB",
+        "wind_speed": "02",
+        "visibility": "10000",
+        "clouds": [{"cloud_type": "FEW", "cloud_height": "020", "cloud_subtype": ""}],
+        "temperature": "31",
+        "dew_point": "26",
+        "pressure": "1010",
+        "trend_type": "NOSIG"
+    })
 ]
 
-def test_metar_parsing():
+def _frozen(value):
+    """Read-only copy of parsed METAR data: lists become tuples, dicts mapping proxies."""
+    if isinstance(value, dict):
+        return types.MappingProxyType({k: _frozen(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(v) for v in value)
+    return value
+
+# Stored as (metar, expected) pairs of immutable containers
+TEST_CASES = tuple((c["metar"], _frozen(c["expected"])) for c in TEST_CASES)
+
+# assertDictEqual reports which keys differ
+_ASSERT = unittest.TestCase()
+_ASSERT.maxDiff = None
+
+@pytest.fixture(scope="session")
+def parsed_corpus():
+    """Every METAR in TEST_CASES, parsed once in a single pass.
+
+    Results are read-only views so one test cannot change what another sees.
+    """
+    return {m: types.MappingProxyType(MetarReader(m).parse()) for m, _ in TEST_CASES}
+
+def _case_id(metar_code):
+    """Short test id for a METAR code, e.g. WADS230030Z."""
+    parts = metar_code.split()
+    return parts[1] + parts[2]
+
+@pytest.mark.parametrize(
+    "metar_code,expected",
+    TEST_CASES,
+    ids=[_case_id(metar_code) for metar_code, _ in TEST_CASES],
+)
+def test_metar_parsing(metar_code, expected, parsed_corpus):
     """Test METAR code parsing with various formats"""
-    for test_case in TEST_CASES:
-        metar_code = test_case["metar"]
-        expected = test_case["expected"]
-        
-        reader = MetarReader(metar_code)
-        result = reader.parse()
-        
-        # Check that all expected values are present in the result
-        for key, value in expected.items():
-            assert result[key] == value, f"Failed parsing {key} in METAR: {metar_code}"
+    result = parsed_corpus[metar_code]
+    # Every expected key in one comparison
+    subset = {key: _frozen(result.get(key)) for key in expected}
+    _ASSERT.assertDictEqual(subset, dict(expected))
+
+def test_parse_metar_cache():
+    """Test that repeated parses of the same METAR reuse the cached result"""
+    metar_code = TEST_CASES[0][0]
+    parse_metar.cache_clear()
 
-def test_variable_wind():
-    """Test parsing of variable wind directions"""
-    test_cases = [
-        {
-            "metar": "METAR WADS 131100Z 19003KT 150V220 7000 SCT018 28/28 Q1008 NOSIG=",
-            "wind_direction": "190",
-            "wind_speed": "03",
-            "variable_from": "150",
-            "variable_to": "220"
-        },
-        {
-            "metar": "METAR WADS 131130Z 12006KT 080V140 5000 RA BKN018 28/27 Q1008 TEMPO TL1230 RA=",
-            "wind_direction": "120",
-            "wind_speed": "06",
-            "variable_from": "080",
-            "variable_to": "140"
-        },
-        {
-            "metar": "METAR WADS 150730Z 34005KT 310V020 9000 SCT020 31/26 Q1007 NOSIG=",
-            "wind_direction": "340",
-            "wind_speed": "05",
-            "variable_from": "310",
-            "variable_to": "020"
-        }
-    ]
-    
-    for test_case in test_cases:
-        reader = MetarReader(test_case["metar"])
-        result = reader.parse()
-        
-        assert result["wind_direction"] == test_case["wind_direction"]
-        assert result["wind_speed"] == test_case["wind_speed"]
-        assert result["wind_variable_from"] == test_case["variable_from"]
-        assert result["wind_variable_to"] == test_case["variable_to"]
+    first = parse_metar(metar_code)
+    second = parse_metar(metar_code)
 
-def test_weather_phenomena():
-    """Test parsing of weather phenomena and remarks"""
-    test_cases = [
-        {
-            "metar": "METAR WADS 130630Z 07004KT 9000 RA BKN018 31/26 Q1006 TEMPO TL0730 RA=",
-            "weather": ["RA"],
-            "trend_type": "TEMPO",
-            "trend_details": "TL0730 RA"
-        },
-        {
-            "metar": "METAR WADS 151700Z VRB02KT 5000 RA FEW015CB BKN017 26/26 Q1010 NOSIG RMK CB OTF=",
-            "weather": ["RA"],
-            "remarks": "RMK CB OTF"
-        },
-        {
-            "metar": "METAR WADS 130200Z 13003KT 9999 FEW018CB SCT020 30/25 Q1010 NOSIG RMK CB TO NW=",
-            "remarks": "RMK CB TO NW"
-        }
-    ]
-    
-    for test_case in test_cases:
-        reader = MetarReader(test_case["metar"])
-        result = reader.parse()
-        
-        if "weather" in test_case:
-            assert all(wx in result["weather"] for wx in test_case["weather"])
-        if "remarks" in test_case:
-            assert result["remarks"] == test_case["remarks"]
-        if "trend_type" in test_case:
-            assert result["trend_type"] == test_case["trend_type"]
-        if "trend_details" in test_case:
-            assert result["trend_details"] == test_case["trend_details"]
+    assert first is second
+    assert first == MetarReader(metar_code).parse()
+    assert parse_metar.cache_info().hits == 1
 
-def test_cloud_types():
-    """Test parsing of different cloud types and special indicators"""
-    test_cases = [
-        {
-            "metar": "METAR WADS 130200Z 13003KT 9999 FEW018CB SCT020 30/25 Q1010 NOSIG RMK CB TO NW=",
-            "expected_clouds": [
-                {"cloud_type": "FEW", "cloud_height": "018", "cloud_subtype": "CB"},
-                {"cloud_type": "SCT", "cloud_height": "020", "cloud_subtype": ""}
-            ]
-        },
-        {
-            "metar": "METAR WADS 150630Z 33008KT 8000 FEW017TCU SCT018 32/26 Q1007 NOSIG RMK TCU TO S=",
-            "expected_clouds": [
-                {"cloud_type": "FEW", "cloud_height": "017", "cloud_subtype": "TCU"},
-                {"cloud_type": "SCT", "cloud_height": "018", "cloud_subtype": ""}
-            ]
-        },
-        {
-            "metar": "METAR WADS 170000Z 13002KT CAVOK 27/25 Q1010 NOSIG=",
-            "expected_clouds": []
-        }
-    ]
-    
-    for test_case in test_cases:
-        reader = MetarReader(test_case["metar"])
-        result = reader.parse()
-        
-        assert result["clouds"] == test_case["expected_clouds"]
+@pytest.mark.benchmark(group="metar-parse")
+@pytest.mark.skipif(importlib.util.find_spec("pytest_benchmark") is None,
+                    reason="pytest-benchmark is not installed")
+def test_parse_perf(benchmark):
+    """Pin the cost of MetarReader.parse; run with -m benchmark"""
+    reader = MetarReader(TEST_CASES[2][0])
+    benchmark.pedantic(reader.parse, rounds=200, iterations=50, warmup_rounds=5)
 
 if __name__ == "__main__":
-    # This allows running the tests with detailed output
-    import sys
-    import pytest
-    sys.exit(pytest.main([__file__, "-v"])) 
\ No newline at end of file
+    # This allows running the tests with detailed output; the cache plugin is
+    # not needed for a one-off run. pytest collects the file again from its
+    # resolved path, as the same test module a normal pytest run would use
+    from pathlib import Path
+    raise SystemExit(pytest.main([
+        str(Path(__file__).resolve()), "-v", "-p", "no:cacheprovider", "-p", "no:stepwise"
+    ]))
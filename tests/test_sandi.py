@@ -0,0 +1,45 @@
+"""
+Tests for the weather code tables.
+"""
+import pytest
+
+from src.data.sandi import arah_angin, arah_angin_lookup
+
+
+@pytest.mark.parametrize("heading,sector", [
+    ("47", "1"), ("93", "2"), ("141", "3"), ("187", "4"),
+    ("226", "5"), ("272", "6"), ("318", "7"), ("352", "8"), ("13", "8"),
+])
+def test_heading_inside_each_sector(heading, sector):
+    assert arah_angin_lookup(heading) == sector
+
+
+@pytest.mark.parametrize("heading,sector", [
+    ("22", "8"), ("23", "1"), ("67", "1"), ("68", "2"), ("112", "2"), ("113", "3"),
+    ("157", "3"), ("158", "4"), ("202", "4"), ("203", "5"), ("247", "5"), ("248", "6"),
+    ("292", "6"), ("293", "7"), ("337", "7"), ("338", "8"),
+])
+def test_sector_boundaries(heading, sector):
+    assert arah_angin_lookup(heading) == sector
+
+
+@pytest.mark.parametrize("heading", ["0", "360", 0, 360])
+def test_north_wraps_around(heading):
+    assert arah_angin_lookup(heading) == "8"
+
+
+def test_matches_every_degree_key_of_table():
+    for key, sector in arah_angin.items():
+        if key.isdigit():
+            assert arah_angin_lookup(key) == sector, key
+
+
+@pytest.mark.parametrize("value", ["", "abc", None, "-5", "361", "12.5"])
+def test_invalid_input_returns_default(value):
+    assert arah_angin_lookup(value) == "0"
+    assert arah_angin_lookup(value, default="/") == "/"
+
+
+def test_symbolic_keys():
+    assert arah_angin_lookup("STNR") == "0"
+    assert arah_angin_lookup("SOUTH WEST") == "5"
@@ -0,0 +1,63 @@
+"""
+Tests for the command queue of the persistent browser worker.
+"""
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from src.ui.modern_app import PersistentWorkerThread
+
+
+@pytest.fixture
+def worker(tmp_path):
+    """A worker whose thread is never started; only its queue is exercised."""
+    return PersistentWorkerThread(str(tmp_path))
+
+
+def _fill_queue(worker):
+    for i in range(PersistentWorkerThread.MAX_PENDING_COMMANDS):
+        worker.send_command('navigate', {'page_type': ('auto_input', 'metar')[i % 2]})
+
+
+def test_full_queue_drops_ordinary_commands(worker):
+    _fill_queue(worker)
+    worker.send_command('reload')
+    assert len(worker._commands) == PersistentWorkerThread.MAX_PENDING_COMMANDS
+    assert worker._commands[-1][0] == 'navigate'
+
+
+@pytest.mark.parametrize("command", ['close', 'stop_auto_send'])
+def test_full_queue_still_accepts_close_and_stop(worker, command):
+    _fill_queue(worker)
+    worker.send_command(command)
+    assert worker._commands[-1] == (command, {})
+
+
+def test_coalesce_drops_consecutive_duplicate_idempotent_commands():
+    nav = ('navigate', {'page_type': 'metar'})
+    batch = [('open', {}), ('open', {}), nav, nav, ('fill', {'user_input': 1}),
+             ('fill', {'user_input': 1}), nav]
+    assert PersistentWorkerThread._coalesce(batch) == [
+        ('open', {}), nav, ('fill', {'user_input': 1}), ('fill', {'user_input': 1}), nav
+    ]
+
+
+def test_coalesce_keeps_alternating_navigation():
+    batch = [('navigate', {'page_type': 'metar'}), ('navigate', {'page_type': 'auto_input'}),
+             ('navigate', {'page_type': 'metar'})]
+    assert PersistentWorkerThread._coalesce(batch) == batch
+
+
+def test_coalesce_close_preempts_queued_work():
+    batch = [('fill', {}), ('close', {}), ('reload', {})]
+    assert PersistentWorkerThread._coalesce(batch) == [('close', {})]
+
+
+def test_coalesce_keeps_shutdown_after_duplicate_close():
+    batch = [('close', {}), ('fill', {}), ('close', {}), ('shutdown', None)]
+    assert PersistentWorkerThread._coalesce(batch) == [('close', {}), ('shutdown', None)]
+
+
+def test_coalesce_without_close_keeps_shutdown():
+    batch = [('reload', {}), ('shutdown', None)]
+    assert PersistentWorkerThread._coalesce(batch) == batch